@@ -3,7 +3,7 @@ import paho.mqtt.client as mqtt
 import json
 from flask import Flask, request, jsonify
 from sqlalchemy import create_engine, Column, String, Integer
-from sqlalchemy.orm import declarative_base, sessionmaker, scoped_session
+from sqlalchemy.orm import declarative_base, sessionmaker
 
 app = Flask(__name__)
 
@@ -34,26 +34,28 @@ def publish_to_mqtt_warehouse2(action, data):
     mqtt_client.connect(broker_url, 1883)
     mqtt_client.publish("warehouse2/inventory/updates", json.dumps(message), qos=1)
 
-# Create a scoped session
-SessionFactory = sessionmaker(bind=engine)
-Session = scoped_session(SessionFactory)
+# Session factory; each request gets a fresh session (and identity map) in a with block
+Session = sessionmaker(bind=engine, expire_on_commit=False)
 
 # Route for scanning and updating the database
 @app.route('/scan', methods=['POST'])
 def scan():
-    session = Session()
-    try:
+    with Session() as session:
         data = request.get_json()
         barcode = data.get('barcode')
 
         # Check if the barcode exists in the database
         item = session.query(Inventory).filter_by(barcode=barcode).first()
         if item:
-            item.quantity += 1
+            # Keep the new values locally so the MQTT payload needs no post-commit attribute reads
+            quantity = item.quantity + 1
+            item.quantity = quantity
+            product_name = item.product_name
             action = 'updated'
         else:
             product_name = "Mapped Product"  # Map barcode to product name as needed
-            new_item = Inventory(barcode=barcode, product_name=product_name, quantity=1)
+            quantity = 1
+            new_item = Inventory(barcode=barcode, product_name=product_name, quantity=quantity)
             session.add(new_item)
             action = 'added'
 
@@ -61,11 +63,9 @@ def scan():
         session.commit()
 
         # Publish the update to MQTT
-        publish_to_mqtt_warehouse2(action, {"barcode": barcode, "product_name": item.product_name if item else product_name, "quantity": item.quantity if item else 1})
+        publish_to_mqtt_warehouse2(action, {"barcode": barcode, "product_name": product_name, "quantity": quantity})
 
         return jsonify({"status": "success", "action": action})
-    finally:
-        session.close()
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
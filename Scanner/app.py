@@ -65,7 +65,7 @@ class Purchase(Base):
     customer = Column(String, nullable=False)
     product_name = Column(String, nullable=False)
     quantity = Column(Integer, nullable=False)
-    date_purchased = Column(String, default=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    date_purchased = Column(String, default=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
 # Create the tables (if not exist)
 Base.metadata.create_all(engine)
@@ -2,23 +2,29 @@ import os
 import sys
 import logging
 import json
+import time
+import contextvars
+import threading
+import bisect
+import queue
 from datetime import datetime
+from types import MappingProxyType
 from flask import Flask, request, jsonify, redirect, url_for, render_template
 from flask_cors import CORS
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
 from werkzeug.security import check_password_hash
 from config import Config
-from functools import wraps
+from functools import wraps, lru_cache
+from itertools import islice
 import ipaddress
-from sqlalchemy import create_engine, Column, String, Integer, event, text
+from sqlalchemy import create_engine, Column, String, Integer, Index, event, text, select
 from sqlalchemy.orm import declarative_base, sessionmaker, scoped_session
 from sqlalchemy.exc import SQLAlchemyError
 import paho.mqtt.client as mqtt
-from dash import Dash, dcc, html, dash_table, callback_context, no_update
+from dash import Dash, dcc, html, dash_table, callback_context, no_update, Patch
 from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 from dash.dependencies import Input, Output, State, ALL
-import sqlite3
 
 # Initialize the Flask app
 app = Flask(__name__)
@@ -144,7 +150,8 @@ db_path = os.path.join(instance_path, 'inventory.db')
 engine = create_engine(
     f'sqlite:///{db_path}',
     connect_args={'check_same_thread': False},
-    pool_size=5,
+    pool_size=16,  # one connection per WSGI server thread (see WSGI_THREADS)
+    max_overflow=8,
     pool_recycle=3600
 )
 
@@ -156,9 +163,52 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor.execute("PRAGMA busy_timeout = 10000")  # 10 seconds timeout
     cursor.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging to improve concurrency
     cursor.close()
+    # Let SQLAlchemy emit BEGIN itself (see do_begin) instead of pysqlite's implicit transactions
+    dbapi_connection.isolation_level = None
     logger.debug("SQLite PRAGMA set for lock timeout and WAL mode.")
 
 
+# Start transactions explicitly; sessions can request IMMEDIATE to take the write lock up front
+@event.listens_for(engine, "begin")
+def do_begin(conn):
+    if conn.get_execution_options().get('sqlite_immediate'):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+    else:
+        conn.exec_driver_sql("BEGIN")
+
+
+# Per-callback SQL statement counter, active only inside functions wrapped with query_budget
+_query_count = contextvars.ContextVar('query_count', default=None)
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def count_queries(conn, cursor, statement, parameters, context, executemany):
+    counter = _query_count.get()
+    # Transaction control from do_begin isn't a query
+    if counter is not None and not statement.startswith('BEGIN'):
+        counter[0] += 1
+
+
+# Decorator to flag callbacks that issue more SQL statements than expected (e.g. N+1 regressions).
+# Only logs: the callback may already have committed, so raising here would hide a completed write.
+def query_budget(max_queries):
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            token = _query_count.set([0])
+            try:
+                return f(*args, **kwargs)
+            finally:
+                count = _query_count.get()[0]
+                _query_count.reset(token)
+                if count > max_queries:
+                    logger.warning(f"{f.__name__} issued {count} queries (budget {max_queries})")
+
+        return decorated_function
+
+    return decorator
+
+
 Base = declarative_base()
 
 
@@ -170,6 +220,11 @@ class Inventory(Base):
     product_name = Column(String)  # Product name mapped from barcode
     quantity = Column(Integer, default=1)
 
+    # Every inventory lookup and update is by product name
+    __table_args__ = (
+        Index('ix_inventory_product', 'product_name'),
+    )
+
 
 # Define the Purchase model to track purchases
 class Purchase(Base):
@@ -178,13 +233,38 @@ class Purchase(Base):
     customer = Column(String, nullable=False)
     product_name = Column(String, nullable=False)
     quantity = Column(Integer, nullable=False)
-    date_purchased = Column(String, default=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    date_purchased = Column(String, default=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+    # Indexes backing the recent-purchases date-range + customer/product filter
+    __table_args__ = (
+        Index('ix_purchase_cust_date', 'customer', 'date_purchased'),
+        Index('ix_purchase_prod_date', 'product_name', 'date_purchased'),
+        # Serves the plain date-range filter and covers the filter option queries without touching the table
+        Index('ix_purchase_date_cust_prod', 'date_purchased', 'customer', 'product_name'),
+    )
 
 
 # Create the tables (if not exist)
 Base.metadata.create_all(engine)
 logger.debug("Database tables created (if not existing).")
 
+# create_all() skips indexes on tables that already exist, so add them to older databases
+for table_index in Inventory.__table__.indexes | Purchase.__table__.indexes:
+    table_index.create(engine, checkfirst=True)
+logger.debug("Inventory and purchase indexes created (if not existing).")
+
+# ix_purchase_date is a prefix of ix_purchase_date_cust_prod, so drop it from older databases
+with engine.begin() as conn:
+    conn.execute(text("DROP INDEX IF EXISTS ix_purchase_date"))
+
+# Partial index so the stock-alert query only walks low-stock rows
+with engine.begin() as conn:
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_inventory_low_stock "
+        "ON inventory(product_name, quantity) WHERE quantity <= 2"
+    ))
+logger.debug("Low-stock partial index created (if not existing).")
+
 # Create a scoped session
 SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
 Session = scoped_session(SessionFactory)
@@ -193,30 +273,126 @@ Session = scoped_session(SessionFactory)
 broker_url = "test.mosquitto.org"
 mqtt_client = mqtt.Client()
 
-# Connect to the MQTT broker
-try:
-    mqtt_client.connect(broker_url, 1883)  # Default port for MQTT
-    mqtt_client.loop_start()  # Start the loop to process MQTT messages
-    logger.debug("Connected to MQTT broker successfully.")
-except Exception as e:
-    logger.error(f"Failed to connect to MQTT broker: {e}")
+# QoS 0 is fire-and-forget (the database stays the source of truth); set MQTT_QOS=1 to require broker acks
+MQTT_QOS = int(os.environ.get('MQTT_QOS', '0'))
+if MQTT_QOS > 0:
+    mqtt_client.max_inflight_messages_set(100)
+
+# Connected lazily by the MQTT worker thread, so importing the app never waits on the broker
+MQTT_MAX_BACKOFF = 60  # seconds
+_mqtt_connected = False
+
+
+# Connect to the MQTT broker, retrying with exponential backoff; only the MQTT worker calls this
+def _ensure_mqtt():
+    global _mqtt_connected
+    delay = 1
+    while not _mqtt_connected:
+        try:
+            mqtt_client.connect(broker_url, 1883)  # Default port for MQTT
+            mqtt_client.loop_start()  # Start the loop to process MQTT messages
+            _mqtt_connected = True
+            logger.debug("Connected to MQTT broker successfully.")
+        except Exception as e:
+            logger.error(f"Failed to connect to MQTT broker: {e}; retrying in {delay}s")
+            time.sleep(delay)
+            delay = min(delay * 2, MQTT_MAX_BACKOFF)
+
+
+# Topic for inventory change messages
+MQTT_TOPIC = "inventory/updates"
+
+# Bumped (under _inventory_cache_lock) on every inventory change so pages can tell when their data is stale
+inventory_version = 0
+
+# Max items per 'bulk_update' message; 'bulk_update' data is a list of {product_name, quantity}
+MQTT_BULK_CHUNK_SIZE = 64
+
+# Messages queued within this many seconds of each other are coalesced before sending
+MQTT_COALESCE_WINDOW = 0.05
+
+# Outgoing (action, data) messages, drained by the MQTT worker thread; bounded so an unreachable
+# broker can't grow it without limit
+MQTT_QUEUE_SIZE = 1000
+_mqtt_queue = queue.Queue(maxsize=MQTT_QUEUE_SIZE)
 
 
 # Function to publish messages to the MQTT broker
 def publish_to_mqtt(action, data):
+    if action in ('add', 'update', 'bulk_update'):
+        # Inventory changed: reload cached quantities on next read, bump the version and drop stale stock alerts
+        expire_inventory_cache()
+        clear_stock_alerts_cache()
+    # Sending happens on the worker thread so callbacks never wait on the network
+    try:
+        _mqtt_queue.put_nowait((action, data))
+    except queue.Full:
+        logger.error(f"MQTT queue full, dropping message: {action} {data}")
+
+
+# Send one message to the broker
+def _send_mqtt_message(action, data):
     message = {
         "action": action,
         "data": data
     }
-    result = mqtt_client.publish("inventory/updates", json.dumps(message), qos=1)  # QoS 1 for delivery guarantee
+    # Compact separators and pre-encoded bytes keep the payload small and skip paho's str encoding
+    payload = json.dumps(message, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    result = mqtt_client.publish(MQTT_TOPIC, payload, qos=MQTT_QOS)
     if result.rc != mqtt.MQTT_ERR_SUCCESS:
         logger.error(f"Failed to publish MQTT message: {result.rc}")
     else:
         logger.debug(f"Published MQTT message: {message}")
 
 
+# Background worker that batches queued messages and publishes them
+def _mqtt_worker():
+    while True:
+        batch = [_mqtt_queue.get()]
+        _ensure_mqtt()
+        deadline = time.monotonic() + MQTT_COALESCE_WINDOW
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_mqtt_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        try:
+            # Quantity changes keep only the latest per product, each under its original action:
+            # 'update' items still go out one per message, 'bulk_update' items are merged into chunks
+            latest = {}
+            for action, data in batch:
+                if action == 'update':
+                    items = [data]
+                elif action == 'bulk_update':
+                    items = data
+                else:
+                    _send_mqtt_message(action, data)
+                    continue
+                for item in items:
+                    latest.pop(item['product_name'], None)
+                    latest[item['product_name']] = (action, item)
+
+            bulk = []
+            for action, item in latest.values():
+                if action == 'update':
+                    _send_mqtt_message('update', item)
+                else:
+                    bulk.append(item)
+            for start in range(0, len(bulk), MQTT_BULK_CHUNK_SIZE):
+                _send_mqtt_message('bulk_update', bulk[start:start + MQTT_BULK_CHUNK_SIZE])
+        except Exception as e:
+            logger.error(f"Error publishing MQTT messages: {e}")
+
+
+threading.Thread(target=_mqtt_worker, name='mqtt-publisher', daemon=True).start()
+
+
 # Updated barcode to product name mapping with new 6-digit prefixes
-barcode_prefix_mapping = {
+barcode_prefix_mapping = MappingProxyType({
     '71013487523': 'Alex Silver',
     '71011154523': 'Newport Silver',
     '71011153523': 'Newport White and Pink',
@@ -238,60 +414,134 @@ barcode_prefix_mapping = {
     '110411': 'Nordon Pine',
     '110664': '#435',
     '210937': 'Kessens Grey',
-}
+})
+
+
+# In-process copy of the inventory table (id -> (product_name, quantity)), loaded on first use.
+# Keyed by row id because product names are not unique. Writes in this app expire it through
+# publish_to_mqtt; it is also reloaded every INVENTORY_CACHE_TTL seconds to pick up rows changed
+# by the scanner apps sharing this database.
+INVENTORY_CACHE_TTL = 10  # seconds
+_inventory_cache = None
+_inventory_cache_expires = 0.0
+_inventory_cache_lock = threading.Lock()
+
+
+# Load or refresh the inventory cache if needed; caller must hold _inventory_cache_lock.
+# Returns False on DB errors when there is no earlier copy to fall back on.
+def _load_inventory_cache():
+    global _inventory_cache, _inventory_cache_expires, inventory_version
+    now = time.monotonic()
+    if _inventory_cache is None or now >= _inventory_cache_expires:
+        try:
+            with engine.connect() as conn:
+                rows = conn.execute(text("SELECT id, product_name, quantity FROM inventory")).all()
+            logger.debug(f"Fetched inventory from DB: {rows}")
+        except Exception as e:
+            logger.error(f"Error fetching inventory from DB: {e}")
+            return _inventory_cache is not None
+        fresh = {row_id: (name, quantity) for row_id, name, quantity in rows}
+        if _inventory_cache is not None and fresh != _inventory_cache:
+            # Changed outside this app: retire version-keyed layouts and stale stock alerts
+            inventory_version += 1
+            clear_stock_alerts_cache()
+        _inventory_cache = fresh
+        _inventory_cache_expires = now + INVENTORY_CACHE_TTL
+    return True
+
+
+# Current inventory version, after refreshing the cache so external writes bump it
+def get_inventory_version():
+    with _inventory_cache_lock:
+        _load_inventory_cache()
+    return inventory_version
 
 
 # Helper function to get inventory from the database
 def get_inventory_from_db():
-    try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT product_name, quantity FROM inventory")
-        rows = cursor.fetchall()
-        conn.close()
-        logger.debug(f"Fetched inventory from DB: {rows}")
-        return [{"product_name": row[0], "quantity": row[1]} for row in rows]
-    except Exception as e:
-        logger.error(f"Error fetching inventory from DB: {e}")
-        return []
+    with _inventory_cache_lock:
+        if not _load_inventory_cache():
+            return []
+        return [{"product_name": name, "quantity": quantity} for name, quantity in _inventory_cache.values()]
+
+
+# Sorted distinct product names for dropdowns
+def get_product_names():
+    with _inventory_cache_lock:
+        if not _load_inventory_cache():
+            return []
+        return sorted({name for name, _ in _inventory_cache.values() if name is not None})
+
 
+# Mark the inventory cache stale so the next read reloads it, and bump inventory_version under the
+# same lock so concurrent writers can't lose an increment. Published changes are per product name,
+# which can match several rows, so they aren't applied to the cache in place.
+def expire_inventory_cache():
+    global _inventory_cache_expires, inventory_version
+    with _inventory_cache_lock:
+        _inventory_cache_expires = 0.0
+        inventory_version += 1
 
-# Helper function to get recent purchases from the database
-def get_recent_purchases_from_db():
+
+# Helper function to get the customers and products with purchases in the last 30 days
+def get_recent_purchase_filter_options():
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT customer, product_name, quantity, date_purchased
-            FROM purchase
-            WHERE date_purchased >= date('now', '-30 days')
-            ORDER BY date_purchased DESC
-        """)
-        rows = cursor.fetchall()
-        conn.close()
-        logger.debug(f"Fetched recent purchases from DB: {rows}")
-        return [{"customer": row[0], "product_name": row[1], "quantity": row[2], "date_purchased": row[3]} for row in
-                rows]
+        with engine.connect() as conn:
+            # scalars() yields the column values directly, with no per-row tuple unwrapping
+            customer_names = conn.execute(text("""
+                SELECT DISTINCT customer FROM purchase
+                WHERE date_purchased >= date('now', '-30 days')
+                ORDER BY 1
+            """)).scalars().all()
+            product_names = conn.execute(text("""
+                SELECT DISTINCT product_name FROM purchase
+                WHERE date_purchased >= date('now', '-30 days')
+                ORDER BY 1
+            """)).scalars().all()
+        return customer_names, product_names
     except Exception as e:
-        logger.error(f"Error fetching recent purchases from DB: {e}")
-        return []
+        logger.error(f"Error fetching recent purchase filter options from DB: {e}")
+        return [], []
+
+
+# Low-stock rows, lowest first; built once so SQLAlchemy reuses the compiled statement
+STOCK_ALERT_STMT = (
+    select(Inventory.product_name, Inventory.quantity)
+    .where(Inventory.quantity <= 2)
+    .order_by(Inventory.quantity)
+)
 
 
 # Helper function to get stock alerts from the database
 def get_stock_alerts_from_db():
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT product_name, quantity FROM inventory WHERE quantity <= 2")
-        rows = cursor.fetchall()
-        conn.close()
+        with engine.connect() as conn:
+            rows = [dict(row) for row in conn.execute(STOCK_ALERT_STMT).mappings()]
         logger.debug(f"Fetched stock alerts from DB: {rows}")
-        return [{"product_name": row[0], "quantity": row[1]} for row in rows]
+        return rows
     except Exception as e:
         logger.error(f"Error fetching stock alerts from DB: {e}")
         return []
 
 
+# Short-lived cache for stock alerts, cleared whenever inventory changes are published
+STOCK_ALERTS_TTL = 5  # seconds
+STOCK_ALERTS_REFRESH_MS = 10 * 1000  # how often the stock alerts page checks for inventory changes
+_stock_alerts_cache = {'data': None, 'expires': 0.0}
+
+
+def get_cached_stock_alerts():
+    now = time.monotonic()
+    if _stock_alerts_cache['data'] is None or now >= _stock_alerts_cache['expires']:
+        _stock_alerts_cache['data'] = get_stock_alerts_from_db()
+        _stock_alerts_cache['expires'] = now + STOCK_ALERTS_TTL
+    return _stock_alerts_cache['data']
+
+
+def clear_stock_alerts_cache():
+    _stock_alerts_cache['data'] = None
+
+
 # Flask before_request to enforce authentication on /dashboard/* routes
 @app.before_request
 def before_request_func():
@@ -321,372 +571,397 @@ dash_app = Dash(
     routes_pathname_prefix='/dashboard/'  # Dash internal routing prefix
 )
 
-# Customer options for the dropdown menu
-customer_options = [
-    {'label': 'A.S. TURNER & SON FUNERAL HOME', 'value': 'A.S. TURNER & SON FUNERAL HOME'},
-    {'label': 'ABBEY FUNERAL HOME', 'value': 'ABBEY FUNERAL HOME'},
-    {'label': 'ADAMS FUNERAL HOME', 'value': 'ADAMS FUNERAL HOME'},
-    {'label': 'AKINS-COBB FUNERALS&CREMATIONS', 'value': 'AKINS-COBB FUNERALS&CREMATIONS'},
-    {'label': 'AL HALL FUNERAL DIRECTORS, INC.', 'value': 'AL HALL FUNERAL DIRECTORS, INC.'},
-    {'label': 'ALABAMA HERITAGE FUNERAL HOME', 'value': 'ALABAMA HERITAGE FUNERAL HOME'},
-    {'label': 'ALBRITTENS FUNERAL SERVICE', 'value': 'ALBRITTENS FUNERAL SERVICE'},
-    {'label': 'ALBRITTON FUNERAL DIRECTORS', 'value': 'ALBRITTON FUNERAL DIRECTORS'},
-    {'label': 'ALDRIDGE FUNERAL SERVICES', 'value': 'ALDRIDGE FUNERAL SERVICES'},
-    {'label': 'ALLEN & ALLEN FUNERAL HOME', 'value': 'ALLEN & ALLEN FUNERAL HOME'},
-    {'label': 'ALLEN FUNERAL HOME', 'value': 'ALLEN FUNERAL HOME'},
-    {'label': 'ALLISON MEMORIAL CHAPEL', 'value': 'ALLISON MEMORIAL CHAPEL'},
-    {'label': 'ANDERSON & MARSHALL FUNERAL HM', 'value': 'ANDERSON & MARSHALL FUNERAL HM'},
-    {'label': 'ANGEL HEIGHTS FUNERAL HOME', 'value': 'ANGEL HEIGHTS FUNERAL HOME'},
-    {'label': 'ARCHER FUNERAL HOME', 'value': 'ARCHER FUNERAL HOME'},
-    {'label': "ARMOUR'S MEMORIAL FUNERAL HOME", 'value': "ARMOUR'S MEMORIAL FUNERAL HOME"},
-    {'label': "ASHLEY'S JH WILLIAMS & SONS FH", 'value': "ASHLEY'S JH WILLIAMS & SONS FH"},
-    {'label': 'BAKER FUNERAL HOME-', 'value': 'BAKER FUNERAL HOME-'},
-    {'label': 'BAKER FUNERAL HOME.', 'value': 'BAKER FUNERAL HOME.'},
-    {'label': 'BALDWIN FUNERAL HOME', 'value': 'BALDWIN FUNERAL HOME'},
-    {'label': 'BANKS FUNERAL HOME', 'value': 'BANKS FUNERAL HOME'},
-    {'label': 'BARNUM FUNERAL HOME', 'value': 'BARNUM FUNERAL HOME'},
-    {'label': 'BATTLE & BATTLE FUNERAL HOME', 'value': 'BATTLE & BATTLE FUNERAL HOME'},
-    {'label': 'BEGGS FUNERAL HOME', 'value': 'BEGGS FUNERAL HOME'},
-    {'label': 'BEGGS FUNERAL HOME, INC.', 'value': 'BEGGS FUNERAL HOME, INC.'},
-    {'label': 'BEGGS FUNERAL HOME, INC."', 'value': 'BEGGS FUNERAL HOME, INC."'},
-    {'label': 'BENTLEY AND SONS FUNERAL HOME', 'value': 'BENTLEY AND SONS FUNERAL HOME'},
-    {'label': 'BENTLEY CARSON MEMORIAL FH', 'value': 'BENTLEY CARSON MEMORIAL FH'},
-    {'label': "BENTLEY'S & SON FUNERAL HOME", 'value': "BENTLEY'S & SON FUNERAL HOME"},
-    {'label': 'BENTLEYS FUNERAL HOME', 'value': 'BENTLEYS FUNERAL HOME'},
-    {'label': 'BEVIS FUNERAL HOME', 'value': 'BEVIS FUNERAL HOME'},
-    {'label': 'BOONE FUNERAL HOME', 'value': 'BOONE FUNERAL HOME'},
-    {'label': 'BOWEN-DONALDSON FH', 'value': 'BOWEN-DONALDSON FH'},
-    {'label': 'BRADLEY ANDERSON FUNERAL HOME', 'value': 'BRADLEY ANDERSON FUNERAL HOME'},
-    {'label': 'BRADWELL MORTUARY', 'value': 'BRADWELL MORTUARY'},
-    {'label': 'BRANNEN FAMILY FUNERAL SERVICE', 'value': 'BRANNEN FAMILY FUNERAL SERVICE'},
-    {'label': 'BRANNEN-NESMITH FUNERAL HOME', 'value': 'BRANNEN-NESMITH FUNERAL HOME'},
-    {'label': 'BRIDGES FUNERAL HOME', 'value': 'BRIDGES FUNERAL HOME'},
-    {'label': "BROCK'S HOMETOWN FUNERAL HOME", 'value': "BROCK'S HOMETOWN FUNERAL HOME"},
-    {'label': 'BROOKSIDE FUNERAL HOME', 'value': 'BROOKSIDE FUNERAL HOME'},
-    {'label': 'BRUTON MORTUARY', 'value': 'BRUTON MORTUARY'},
-    {'label': 'BRYANT FUNERAL HOME', 'value': 'BRYANT FUNERAL HOME'},
-    {'label': "BURDEN'S FUNERAL HOME", 'value': "BURDEN'S FUNERAL HOME"},
-    {'label': 'BURTON FUNERAL HOME', 'value': 'BURTON FUNERAL HOME'},
-    {'label': 'BYRD & FLANIGAN FUNERAL HOME', 'value': 'BYRD & FLANIGAN FUNERAL HOME'},
-    {'label': 'C.O. HOLLOWAY MORTUARY', 'value': 'C.O. HOLLOWAY MORTUARY'},
-    {'label': 'CARL WILLIAMS FUNERAL DIRECTORS', 'value': 'CARL WILLIAMS FUNERAL DIRECTORS'},
-    {'label': 'CARSON McLANE FUNERAL HOME', 'value': 'CARSON McLANE FUNERAL HOME'},
-    {'label': 'CARTER FUNERAL HOME', 'value': 'CARTER FUNERAL HOME'},
-    {'label': 'CARTER FUNERAL HOME.', 'value': 'CARTER FUNERAL HOME.'},
-    {'label': 'CARTER OGLETHORPE CHAPEL', 'value': 'CARTER OGLETHORPE CHAPEL'},
-    {'label': 'CELEBRATION OF LIFE MEMORIAL', 'value': 'CELEBRATION OF LIFE MEMORIAL'},
-    {'label': 'CENTRAL FUNERAL HOME', 'value': 'CENTRAL FUNERAL HOME'},
-    {'label': "CHANDLER'S FUNERAL HOME", 'value': "CHANDLER'S FUNERAL HOME"},
-    {'label': 'CHAPEL HILL MORTUARY', 'value': 'CHAPEL HILL MORTUARY'},
-    {'label': 'CHAPMAN FUNERAL CHAPEL', 'value': 'CHAPMAN FUNERAL CHAPEL'},
-    {'label': 'CHAPMAN FUNERAL HOME', 'value': 'CHAPMAN FUNERAL HOME'},
-    {'label': 'CHARLES MCDOUGALD FUNERAL HOME', 'value': 'CHARLES MCDOUGALD FUNERAL HOME'},
-    {'label': 'CHARLES McCLELLAN FUNERAL HOME', 'value': 'CHARLES McCLELLAN FUNERAL HOME'},
-    {'label': 'CLARK FUNERAL HOME', 'value': 'CLARK FUNERAL HOME'},
-    {'label': 'CLARK FUNERAL HOME-', 'value': 'CLARK FUNERAL HOME-'},
-    {'label': 'CLARK MEMORIAL FUNERAL SERVICE', 'value': 'CLARK MEMORIAL FUNERAL SERVICE'},
-    {'label': 'CLAUDE A. MCKIBBEN & SONS FH', 'value': 'CLAUDE A. MCKIBBEN & SONS FH'},
-    {'label': 'CLAYTON MEMORIAL CHAPEL', 'value': 'CLAYTON MEMORIAL CHAPEL'},
-    {'label': 'CLOUD FUNERAL HOME', 'value': 'CLOUD FUNERAL HOME'},
-    {'label': 'CM BROWN FUNERAL HOME', 'value': 'CM BROWN FUNERAL HOME'},
-    {'label': 'COBB FUNERAL CHAPEL', 'value': 'COBB FUNERAL CHAPEL'},
-    {'label': 'COES FUNERAL HOME', 'value': 'COES FUNERAL HOME'},
-    {'label': 'COGGINS FUNERAL HOME', 'value': 'COGGINS FUNERAL HOME'},
-    {'label': 'COLLINS FUNERAL HOME', 'value': 'COLLINS FUNERAL HOME'},
-    {'label': 'COLONIAL FUNERAL HOME', 'value': 'COLONIAL FUNERAL HOME'},
-    {'label': 'COLQUITT FUNERAL HOME', 'value': 'COLQUITT FUNERAL HOME'},
-    {'label': 'COMMUNITY FUNERAL HOME', 'value': 'COMMUNITY FUNERAL HOME'},
-    {'label': 'CONNER-WESTBERRY FUNERAL HOME', 'value': 'CONNER-WESTBERRY FUNERAL HOME'},
-    {'label': 'COX-IVEY FUNERAL HOME', 'value': 'COX-IVEY FUNERAL HOME'},
-    {'label': 'CRAIG R. TREMBLE FUNERAL HOME-', 'value': 'CRAIG R. TREMBLE FUNERAL HOME-'},
-    {'label': 'CRAWFORD & MOULTRY FH', 'value': 'CRAWFORD & MOULTRY FH'},
-    {'label': 'CROSBY FUNERAL HOME-', 'value': 'CROSBY FUNERAL HOME-'},
-    {'label': 'CURTIS FUNERAL HOME', 'value': 'CURTIS FUNERAL HOME'},
-    {'label': 'DEAL FUNERAL DIRECTORS', 'value': 'DEAL FUNERAL DIRECTORS'},
-    {'label': 'D.A.E. ENTERPRISE, LLC', 'value': 'D.A.E. ENTERPRISE, LLC'},
-    {'label': 'DARRELL E WATKINS FUNERAL HOME', 'value': 'DARRELL E WATKINS FUNERAL HOME'},
-    {'label': 'DAVIS FUNERAL HOME', 'value': 'DAVIS FUNERAL HOME'},
-    {'label': 'DAVIS MEMORIAL MORTUARY', 'value': 'DAVIS MEMORIAL MORTUARY'},
-    {'label': 'DILLARD FUNERAL HOME', 'value': 'DILLARD FUNERAL HOME'},
-    {'label': 'DIVINE MORTUARY & CREMATIONS', 'value': 'DIVINE MORTUARY & CREMATIONS'},
-    {'label': 'DONALD TRIMBLE MORTUARY, INC.', 'value': 'DONALD TRIMBLE MORTUARY, INC.'},
-    {'label': 'DORCHESTER FUNERAL HOME', 'value': 'DORCHESTER FUNERAL HOME'},
-    {'label': 'DUDLEY FUNERAL HOME', 'value': 'DUDLEY FUNERAL HOME'},
-    {'label': 'E.T. HOSLEY MEMORIAL', 'value': 'E.T. HOSLEY MEMORIAL'},
-    {'label': 'EDWARDS-SMALL MORTUARY', 'value': 'EDWARDS-SMALL MORTUARY'},
-    {'label': 'ELLIOTT FUNERAL HOME', 'value': 'ELLIOTT FUNERAL HOME'},
-    {'label': 'ELLIOTT PARHAM MORTUARY', 'value': 'ELLIOTT PARHAM MORTUARY'},
-    {'label': 'ELLISON MEMORIAL FUNERAL HOME', 'value': 'ELLISON MEMORIAL FUNERAL HOME'},
-    {'label': 'ERIC BROWN FUNERAL HOME', 'value': 'ERIC BROWN FUNERAL HOME'},
-    {'label': 'EVANS-SKIPPER FUNERAL HOME', 'value': 'EVANS-SKIPPER FUNERAL HOME'},
-    {'label': 'F.L. SIMS FUNERAL HOME', 'value': 'F.L. SIMS FUNERAL HOME'},
-    {'label': 'FAITH FUNERAL HOME', 'value': 'FAITH FUNERAL HOME'},
-    {'label': 'FAMILY FIRST FUNERAL CARE', 'value': 'FAMILY FIRST FUNERAL CARE'},
-    {'label': 'FAMILY FUNERAL HOME', 'value': 'FAMILY FUNERAL HOME'},
-    {'label': 'FERGUSON FUNERAL HOME', 'value': 'FERGUSON FUNERAL HOME'},
-    {'label': 'FIELDS FUNERAL HOME', 'value': 'FIELDS FUNERAL HOME'},
-    {'label': 'FLANDERS MORRISON FUNERAL HOME', 'value': 'FLANDERS MORRISON FUNERAL HOME'},
-    {'label': 'FLANIGAN FUNERAL HOME', 'value': 'FLANIGAN FUNERAL HOME'},
-    {'label': 'FORD-STEWART FUNERAL HOME', 'value': 'FORD-STEWART FUNERAL HOME'},
-    {'label': 'FRAZIER AND SON FUNERAL HOME', 'value': 'FRAZIER AND SON FUNERAL HOME'},
-    {'label': 'FREDERICK-DEAN FUNERAL HOME', 'value': 'FREDERICK-DEAN FUNERAL HOME'},
-    {'label': 'FREEMAN FUNERAL HOME', 'value': 'FREEMAN FUNERAL HOME'},
-    {'label': 'FUQUA - BANKSTON FUNERAL HOME', 'value': 'FUQUA - BANKSTON FUNERAL HOME'},
-    {'label': 'GARDENS OF MEMORY-BAINBRIDGE', 'value': 'GARDENS OF MEMORY-BAINBRIDGE'},
-    {'label': 'GATLIN MORTUARY INC.', 'value': 'GATLIN MORTUARY INC.'},
-    {'label': 'GETHSEMANE MEMORIALS', 'value': 'GETHSEMANE MEMORIALS'},
-    {'label': 'GLOVER MORTUARY', 'value': 'GLOVER MORTUARY'},
-    {'label': 'GODFREY FUNERAL HOME, LLC', 'value': 'GODFREY FUNERAL HOME, LLC'},
-    {'label': 'GOLDEN GATES BURIAL& CREMATION', 'value': 'GOLDEN GATES BURIAL& CREMATION'},
-    {'label': 'GRACE FUNERAL & CREMATION SVCS', 'value': 'GRACE FUNERAL & CREMATION SVCS'},
-    {'label': 'GREEN HILLS FUNERAL HOME', 'value': 'GREEN HILLS FUNERAL HOME'},
-    {'label': 'GREG HANCOCK FUNERAL CHAPEL', 'value': 'GREG HANCOCK FUNERAL CHAPEL'},
-    {'label': 'GREGORY B. LEVETT & SONS FH', 'value': 'GREGORY B. LEVETT & SONS FH'},
-    {'label': 'GROOMS FUNERAL HOME', 'value': 'GROOMS FUNERAL HOME'},
-    {'label': 'GRUBBS FUNERAL HOME', 'value': 'GRUBBS FUNERAL HOME'},
-    {'label': 'GUERRY FUNERAL HOME', 'value': 'GUERRY FUNERAL HOME'},
-    {'label': "GUS THORNHILL'S FUNERAL HOME", 'value': "GUS THORNHILL'S FUNERAL HOME"},
-    {'label': "HADLEY'S FUNERAL HOME", 'value': "HADLEY'S FUNERAL HOME"},
-    {'label': 'HAGAN FUNERAL SERVICE', 'value': 'HAGAN FUNERAL SERVICE'},
-    {'label': 'HAILE FUNERAL HOME', 'value': 'HAILE FUNERAL HOME'},
-    {'label': 'HAISTEN FUNERAL HOME', 'value': 'HAISTEN FUNERAL HOME'},
-    {'label': 'HALL & HALL FUNERAL HOME', 'value': 'HALL & HALL FUNERAL HOME'},
-    {'label': 'HALLS FUNERAL HOME', 'value': 'HALLS FUNERAL HOME'},
-    {'label': 'HAMILTON-BURCH FH', 'value': 'HAMILTON-BURCH FH'},
-    {'label': 'HAMMOND FUNERAL HOME', 'value': 'HAMMOND FUNERAL HOME'},
-    {'label': 'HANCOCK FUNERAL HOME', 'value': 'HANCOCK FUNERAL HOME'},
-    {'label': 'HARRELLS FUNERAL HOME', 'value': 'HARRELLS FUNERAL HOME'},
-    {'label': 'HARRINGTON FAMILY FS- WAYCROSS', 'value': 'HARRINGTON FAMILY FS- WAYCROSS'},
-    {'label': 'HARRINGTON FUNERAL HOME', 'value': 'HARRINGTON FUNERAL HOME'},
-    {'label': 'HARRINGTON MORTUARY &CREMATION', 'value': 'HARRINGTON MORTUARY &CREMATION'},
-    {'label': 'HARRIS MORTUARY, INC.', 'value': 'HARRIS MORTUARY, INC.'},
-    {'label': 'HART FUNERAL HOME', 'value': 'HART FUNERAL HOME'},
-    {'label': 'HARVEY FUNERAL HOME', 'value': 'HARVEY FUNERAL HOME'},
-    {'label': 'HATCHER-PEOPLES FUNERAL HOME', 'value': 'HATCHER-PEOPLES FUNERAL HOME'},
-    {'label': "HENDERSON'S MEMORIAL CHAPEL", 'value': "HENDERSON'S MEMORIAL CHAPEL"},
-    {'label': 'HERITAGE FUNERAL HOME', 'value': 'HERITAGE FUNERAL HOME'},
-    {'label': 'HERITAGE FUNERAL HOME-', 'value': 'HERITAGE FUNERAL HOME-'},
-    {'label': 'HERSCHEL THORNTON MORTUARY', 'value': 'HERSCHEL THORNTON MORTUARY'},
-    {'label': 'HICKS & SONS MORTUARY', 'value': 'HICKS & SONS MORTUARY'},
-    {'label': 'HICKS FUNERAL HOME', 'value': 'HICKS FUNERAL HOME'},
-    {'label': 'HIGGINS FUNERAL HOME', 'value': 'HIGGINS FUNERAL HOME'},
-    {'label': 'HIGGS FUNERAL HOME', 'value': 'HIGGS FUNERAL HOME'},
-    {'label': 'HILL-WATSON MEMORIAL CHAPEL', 'value': 'HILL-WATSON MEMORIAL CHAPEL'},
-    {'label': 'HILL-WATSON-PEOPLES FUNERAL HM', 'value': 'HILL-WATSON-PEOPLES FUNERAL HM'},
-    {'label': 'HILLS FUNERAL HOME', 'value': 'HILLS FUNERAL HOME'},
-    {'label': 'HOLMAN FUNERAL HOME-OZARK', 'value': 'HOLMAN FUNERAL HOME-OZARK'},
-    {'label': 'HOLMAN-HEADLAND MORTUARY. INC', 'value': 'HOLMAN-HEADLAND MORTUARY. INC'},
-    {'label': 'HOPKINS MORTUARY', 'value': 'HOPKINS MORTUARY'},
-    {'label': 'HOUSE OF TOWNS MORTUARY', 'value': 'HOUSE OF TOWNS MORTUARY'},
-    {'label': 'HOWARD FUNERAL HOME', 'value': 'HOWARD FUNERAL HOME'},
-    {'label': "HUFF'S INTERNATIONAL FH", 'value': "HUFF'S INTERNATIONAL FH"},
-    {'label': 'HUNTER-ALLEN-MYHAND FH', 'value': 'HUNTER-ALLEN-MYHAND FH'},
-    {'label': 'HUTCHESON-CROFT FUNERAL HOME', 'value': 'HUTCHESON-CROFT FUNERAL HOME'},
-    {'label': "HUTCHESON'S MEMORIAL CHAPEL", 'value': "HUTCHESON'S MEMORIAL CHAPEL"},
-    {'label': 'INDEPENDENT FUNERAL HOME', 'value': 'INDEPENDENT FUNERAL HOME'},
-    {'label': 'IVEY FUNERAL HOME', 'value': 'IVEY FUNERAL HOME'},
-    {'label': 'IVEY FUNERAL HOME', 'value': 'IVEY FUNERAL HOME'},
-    {'label': 'IVIE FUNERAL HOME', 'value': 'IVIE FUNERAL HOME'},
-    {'label': 'J. COLLINS FUNERAL HOME', 'value': 'J. COLLINS FUNERAL HOME'},
-    {'label': 'J.L. LITMAN FUNERAL SERVICE', 'value': 'J.L. LITMAN FUNERAL SERVICE'},
-    {'label': 'J.MELLIE NESMITH FH', 'value': 'J.MELLIE NESMITH FH'},
-    {'label': 'J.W. WILLIAMS FUNERAL HOME', 'value': 'J.W. WILLIAMS FUNERAL HOME'},
-    {'label': 'JAMES & LIPFORD FUNERAL HOME', 'value': 'JAMES & LIPFORD FUNERAL HOME'},
-    {'label': 'JAMES & SIKES FUNERAL HOMES', 'value': 'JAMES & SIKES FUNERAL HOMES'},
-    {'label': 'JAMES A. THOMAS F H', 'value': 'JAMES A. THOMAS F H'},
-    {'label': 'JANAZA SERVICES OF GA INC.', 'value': 'JANAZA SERVICES OF GA INC.'},
-    {'label': 'JEFF JONES FUNERAL HOME', 'value': 'JEFF JONES FUNERAL HOME'},
-    {'label': 'JEFFCOAT - TRANT FUNERAL HOME', 'value': 'JEFFCOAT - TRANT FUNERAL HOME'},
-    {'label': 'JEFFCOAT FUNERAL HOME', 'value': 'JEFFCOAT FUNERAL HOME'},
-    {'label': 'JH WILLIAMS AND SONS INC.', 'value': 'JH WILLIAMS AND SONS INC.'},
-    {'label': 'JOHNSON & SON FUNERAL SERVICE', 'value': 'JOHNSON & SON FUNERAL SERVICE'},
-    {'label': 'JOHNSON BROWN SERVICE FH', 'value': 'JOHNSON BROWN SERVICE FH'},
-    {'label': 'JOHNSON FUNERAL & CREMATION', 'value': 'JOHNSON FUNERAL & CREMATION'},
-    {'label': 'JOINER-ANDERSON FUNERAL HOME', 'value': 'JOINER-ANDERSON FUNERAL HOME'},
-    {'label': 'JONES BROTHERS MEMORIAL CHAPEL', 'value': 'JONES BROTHERS MEMORIAL CHAPEL'},
-    {'label': 'JORDAN FUNERAL HOME', 'value': 'JORDAN FUNERAL HOME'},
-    {'label': 'JOSEPH W. JONES FUNERAL HOME', 'value': 'JOSEPH W. JONES FUNERAL HOME'},
-    {'label': 'JP MOORE MORTUARY & CREMATION', 'value': 'JP MOORE MORTUARY & CREMATION'},
-    {'label': 'K.L. CLOSE FUNERAL HOME', 'value': 'K.L. CLOSE FUNERAL HOME'},
-    {'label': 'KIMBRELL-STERN FD', 'value': 'KIMBRELL-STERN FD'},
-    {'label': 'KIMBROUGH FUNERAL HOME', 'value': 'KIMBROUGH FUNERAL HOME'},
-    {'label': 'KING BROTHERS FUNERAL HOME', 'value': 'KING BROTHERS FUNERAL HOME'},
-    {'label': 'KURT DEAL FUNERAL', 'value': 'KURT DEAL FUNERAL'},
-    {'label': 'LAKES-DUNSON-ROBERTSON FH', 'value': 'LAKES-DUNSON-ROBERTSON FH'},
-    {'label': 'LAKEVIEW MEMORY GARDENS', 'value': 'LAKEVIEW MEMORY GARDENS'},
-    {'label': "LAMB'S INTERNATIONAL FH", 'value': "LAMB'S INTERNATIONAL FH"},
-    {'label': 'LANE MEMORIAL CHAPEL', 'value': 'LANE MEMORIAL CHAPEL'},
-    {'label': 'LEAK-MEMORY FH/ LOC 4338', 'value': 'LEAK-MEMORY FH/ LOC 4338'},
-    {'label': 'LEES FUNERAL HOME & CREMATORY', 'value': 'LEES FUNERAL HOME & CREMATORY'},
-    {'label': 'LEMON FUNERAL HOME', 'value': 'LEMON FUNERAL HOME'},
-    {'label': 'LEONARD FUNERAL HOME', 'value': 'LEONARD FUNERAL HOME'},
-    {'label': 'LESTER LACKEY AND SONS FH', 'value': 'LESTER LACKEY AND SONS FH'},
-    {'label': 'LEWIS MORTUARY', 'value': 'LEWIS MORTUARY'},
-    {'label': 'LIFESONG FUNERAL HOME', 'value': 'LIFESONG FUNERAL HOME'},
-    {'label': 'LINVILLE MEMORIAL FUNERAL HOME', 'value': 'LINVILLE MEMORIAL FUNERAL HOME'},
-    {'label': 'LITTLE-WARD FUNERAL HOME', 'value': 'LITTLE-WARD FUNERAL HOME'},
-    {'label': 'LOVEIN FUNERAL HOME', 'value': 'LOVEIN FUNERAL HOME'},
-    {'label': 'LOWE FUNERAL HOME', 'value': 'LOWE FUNERAL HOME'},
-    {'label': 'LUKE STRONG & SON MORTUARY', 'value': 'LUKE STRONG & SON MORTUARY'},
-    {'label': 'LUNSFORD FUNERAL HOME', 'value': 'LUNSFORD FUNERAL HOME'},
-    {'label': 'M.D. WALKER FUNERAL HOME', 'value': 'M.D. WALKER FUNERAL HOME'},
-    {'label': 'MACKY WILSON JENNINGS FH', 'value': 'MACKY WILSON JENNINGS FH'},
-    {'label': 'MAGNOLIA CREMATIONS', 'value': 'MAGNOLIA CREMATIONS'},
-    {'label': 'MANRY JORDAN HODGES FH', 'value': 'MANRY JORDAN HODGES FH'},
-    {'label': 'MARIANNA CHAPEL FUNERAL HOME', 'value': 'MARIANNA CHAPEL FUNERAL HOME'},
-    {'label': 'MARIETTA FUNERAL HOME', 'value': 'MARIETTA FUNERAL HOME'},
-    {'label': 'MARTIN LUTHER KING MEMORIAL', 'value': 'MARTIN LUTHER KING MEMORIAL'},
-    {'label': 'MATHEWS FUNERAL HOME', 'value': 'MATHEWS FUNERAL HOME'},
-    {'label': 'MAX BRANNON & SONS FH', 'value': 'MAX BRANNON & SONS FH'},
-    {'label': 'MAY & SMITH FUNERAL DIRECTORS', 'value': 'MAY & SMITH FUNERAL DIRECTORS'},
-    {'label': 'MCALPIN FUNERAL HOME', 'value': 'MCALPIN FUNERAL HOME'},
-    {'label': 'MCCOY FUNERAL HOME-MANCHESTER', 'value': 'MCCOY FUNERAL HOME-MANCHESTER'},
-    {'label': 'MCCULLOUGH FUNERAL HOME', 'value': 'MCCULLOUGH FUNERAL HOME'},
-    {'label': "McIVER FUNERAL HOME", 'value': "McIVER FUNERAL HOME"},
-    {'label': "MCKENZIE'S FUNERAL HOME", 'value': "MCKENZIE'S FUNERAL HOME"},
-    {'label': 'MCKOON FUNERAL HOME', 'value': 'MCKOON FUNERAL HOME'},
-    {'label': 'MCMULLEN FUNERAL HOME', 'value': 'MCMULLEN FUNERAL HOME'},
-    {'label': 'MEADOWS FUNERAL HOME', 'value': 'MEADOWS FUNERAL HOME'},
-    {'label': 'MEADOWS FUNERAL HOME, INC.', 'value': 'MEADOWS FUNERAL HOME, INC.'},
-    {'label': 'MEMORY CHAPEL FUNERAL HOME', 'value': 'MEMORY CHAPEL FUNERAL HOME'},
-    {'label': 'MILES FUNERAL HOME', 'value': 'MILES FUNERAL HOME'},
-    {'label': 'MILES-ODUM FUNERAL HOME', 'value': 'MILES-ODUM FUNERAL HOME'},
-    {'label': 'MILLER FUNERAL HOME TALLAPOOSA', 'value': 'MILLER FUNERAL HOME TALLAPOOSA'},
-    {'label': 'MONROE COUNTY MEMORIAL CHAPEL', 'value': 'MONROE COUNTY MEMORIAL CHAPEL'},
-    {'label': 'MOODY-DANIEL FUNERAL HOME', 'value': 'MOODY-DANIEL FUNERAL HOME'},
-    {'label': 'MOORE FUNERAL HOME', 'value': 'MOORE FUNERAL HOME'},
-    {'label': "MORGAN & SON'S FUNERAL HOME", 'value': "MORGAN & SON'S FUNERAL HOME"},
-    {'label': 'MORGAN & SONS FUNERAL HOME', 'value': 'MORGAN & SONS FUNERAL HOME'},
-    {'label': 'MUSIC FUNERAL HOME', 'value': 'MUSIC FUNERAL HOME'},
-    {'label': 'MUSIC FUNERAL HOME -', 'value': 'MUSIC FUNERAL HOME -'},
-    {'label': "NELSON'S MEMORIAL MORTUARY", 'value': "NELSON'S MEMORIAL MORTUARY"},
-    {'label': 'NEW GENERATION MEMORIAL MORT.', 'value': 'NEW GENERATION MEMORIAL MORT.'},
-    {'label': 'NOBLES FUNERAL HOME & CREMATORY', 'value': 'NOBLES FUNERAL HOME & CREMATORY'},
-    {'label': 'OGLETHORPE FUNERAL CHAPEL', 'value': 'OGLETHORPE FUNERAL CHAPEL'},
-    {'label': 'OXLEY-HEARD FUNERAL DIRECTORS', 'value': 'OXLEY-HEARD FUNERAL DIRECTORS'},
-    {'label': 'PARKER - BRAMLETT FUNERAL HOME', 'value': 'PARKER - BRAMLETT FUNERAL HOME'},
-    {'label': 'PARROTT FUNERAL HOME', 'value': 'PARROTT FUNERAL HOME'},
-    {'label': 'PASCHAL MEMORIAL FUNERAL HOME', 'value': 'PASCHAL MEMORIAL FUNERAL HOME'},
-    {'label': 'PASCO GAINER SR. FUNERAL HOME', 'value': 'PASCO GAINER SR. FUNERAL HOME'},
-    {'label': 'PAULK FUNERAL HOME', 'value': 'PAULK FUNERAL HOME'},
-    {'label': 'PEARSON - DIAL FUNERAL HOME', 'value': 'PEARSON - DIAL FUNERAL HOME'},
-    {'label': "PEEL' FUNERAL HOME", 'value': "PEEL' FUNERAL HOME"},
-    {'label': 'PEOPLES FUNERAL HOME', 'value': 'PEOPLES FUNERAL HOME'},
-    {'label': "PEOPLES' FUNERAL HOME- T", 'value': "PEOPLES' FUNERAL HOME- T"},
-    {'label': 'PERKINS FUNERAL HOME', 'value': 'PERKINS FUNERAL HOME'},
-    {'label': 'PERRY BROTHERS FUNERAL HOME', 'value': 'PERRY BROTHERS FUNERAL HOME'},
-    {'label': 'PERRY FUNERAL CHAPEL', 'value': 'PERRY FUNERAL CHAPEL'},
-    {'label': 'PETERSON & WILLIAMS FH', 'value': 'PETERSON & WILLIAMS FH'},
-    {'label': "PETERSON'S FUNERAL HOME", 'value': "PETERSON'S FUNERAL HOME"},
-    {'label': 'PHILLIPS & RILEY FUNERAL HOME', 'value': 'PHILLIPS & RILEY FUNERAL HOME'},
-    {'label': 'POOLE FUNERAL HOME & CREMATION', 'value': 'POOLE FUNERAL HOME & CREMATION'},
-    {'label': 'PROGRESSIVE FUNERAL HOME', 'value': 'PROGRESSIVE FUNERAL HOME'},
-    {'label': 'PROMISE LAND FUNERAL HOME', 'value': 'PROMISE LAND FUNERAL HOME'},
-    {'label': 'RADNEY FUNERAL HOME', 'value': 'RADNEY FUNERAL HOME'},
-    {'label': 'RAINEY FUNERAL HOME', 'value': 'RAINEY FUNERAL HOME'},
-    {'label': 'RAINGE MEMORIAL CHAPEL', 'value': 'RAINGE MEMORIAL CHAPEL'},
-    {'label': 'RAINWATER FUNERAL HOME', 'value': 'RAINWATER FUNERAL HOME'},
-    {'label': 'REECE FUNERAL HOME', 'value': 'REECE FUNERAL HOME'},
-    {'label': 'RELIHAN FUNERAL HOME', 'value': 'RELIHAN FUNERAL HOME'},
-    {'label': 'RICHARDSON FUNERAL HOME', 'value': 'RICHARDSON FUNERAL HOME'},
-    {'label': "RICHARDSON'S FAMILY FUNERAL CA", 'value': "RICHARDSON'S FAMILY FUNERAL CA"},
-    {'label': 'RICHMOND HILL FUNERAL HOME', 'value': 'RICHMOND HILL FUNERAL HOME'},
-    {'label': 'RICKETSON FUNERAL HOME', 'value': 'RICKETSON FUNERAL HOME'},
-    {'label': "RIDOUT'S PRATTVILLE CHAPEL", 'value': "RIDOUT'S PRATTVILLE CHAPEL"},
-    {'label': 'RINEHART & SONS FUNERAL HOME', 'value': 'RINEHART & SONS FUNERAL HOME'},
-    {'label': 'ROLLINS FUNERAL HOME', 'value': 'ROLLINS FUNERAL HOME'},
-    {'label': 'RONNIE L. STEWART FS', 'value': 'RONNIE L. STEWART FS'},
-    {'label': 'ROOKS FUNERAL HOME', 'value': 'ROOKS FUNERAL HOME'},
-    {'label': 'ROSADALE FUNERAL PARLOR, INC.', 'value': 'ROSADALE FUNERAL PARLOR, INC.'},
-    {'label': 'ROSCOE JENKINS FUNERAL HOME', 'value': 'ROSCOE JENKINS FUNERAL HOME'},
-    {'label': 'ROSS - CLAYTON FUNERAL HOME', 'value': 'ROSS - CLAYTON FUNERAL HOME'},
-    {'label': 'ROYAL FUNERAL HOME', 'value': 'ROYAL FUNERAL HOME'},
-    {'label': 'RUSSELL WRIGHT MORTUARY', 'value': 'RUSSELL WRIGHT MORTUARY'},
-    {'label': 'SAMMONS FUNERAL HOME', 'value': 'SAMMONS FUNERAL HOME'},
-    {'label': 'SCONIERS FUNERAL HOME', 'value': 'SCONIERS FUNERAL HOME'},
-    {'label': 'SCOTT & ROBERTS FUNERAL HOME', 'value': 'SCOTT & ROBERTS FUNERAL HOME'},
-    {'label': 'SELMA FUNERAL HOME', 'value': 'SELMA FUNERAL HOME'},
-    {'label': 'SERENITY FUNERAL HOME', 'value': 'SERENITY FUNERAL HOME'},
-    {'label': 'SEROYER FUNERAL HOME', 'value': 'SEROYER FUNERAL HOME'},
-    {'label': 'SHEPARD- ROBERSON FUNERAL HOME', 'value': 'SHEPARD- ROBERSON FUNERAL HOME'},
-    {'label': 'SHERRELL-WESTBERRY FUNERAL HOM', 'value': 'SHERRELL-WESTBERRY FUNERAL HOM'},
-    {'label': "SHIPP'S FUNERAL HOME", 'value': "SHIPP'S FUNERAL HOME"},
-    {'label': 'SIMS FUNERAL HOME', 'value': 'SIMS FUNERAL HOME'},
-    {'label': 'SIMS FUNERAL HOME -', 'value': 'SIMS FUNERAL HOME -'},
-    {'label': 'SMITH FUNERAL HOME', 'value': 'SMITH FUNERAL HOME'},
-    {'label': 'SO. CREMATIONS AT HOLLY HILL', 'value': 'SO. CREMATIONS AT HOLLY HILL'},
-    {'label': 'SONJA COAXUM', 'value': 'SONJA COAXUM'},
-    {'label': 'SOUTHERN HERITAGE FUNERAL HOME', 'value': 'SOUTHERN HERITAGE FUNERAL HOME'},
-    {'label': 'SOUTHERN MEMORIAL FH', 'value': 'SOUTHERN MEMORIAL FH'},
-    {'label': 'SOUTHVIEW MORTUARY', 'value': 'SOUTHVIEW MORTUARY'},
-    {'label': 'SPAULDING & BARNES FH', 'value': 'SPAULDING & BARNES FH'},
-    {'label': 'STANFORD MEMORIAL CHAPEL', 'value': 'STANFORD MEMORIAL CHAPEL'},
-    {'label': 'STANLEY FUNERAL HOME', 'value': 'STANLEY FUNERAL HOME'},
-    {'label': 'STEVENS FUNERAL HOME', 'value': 'STEVENS FUNERAL HOME'},
-    {'label': 'STEVENS-MCGHEE FUNERAL HOME', 'value': 'STEVENS-MCGHEE FUNERAL HOME'},
-    {'label': 'STOKES - SOUTHERLAND F.H.', 'value': 'STOKES - SOUTHERLAND F.H.'},
-    {'label': 'STOVALL FUNERAL HOME', 'value': 'STOVALL FUNERAL HOME'},
-    {'label': 'STRIFFLER - HAMBY MORTUARY', 'value': 'STRIFFLER - HAMBY MORTUARY'},
-    {'label': 'STRIFFLER-HAMBY MORTUARY', 'value': 'STRIFFLER-HAMBY MORTUARY'},
-    {'label': 'STRONG & JONES FUNERAL HOME', 'value': 'STRONG & JONES FUNERAL HOME'},
-    {'label': 'SUNSET MEMORIAL PARK', 'value': 'SUNSET MEMORIAL PARK'},
-    {'label': "SWAIN'S FUNERAL HOME", 'value': "SWAIN'S FUNERAL HOME"},
-    {'label': 'T.J. BEGGS JR. & SONS FH', 'value': 'T.J. BEGGS JR. & SONS FH'},
-    {'label': 'T.V.WILLIAMS FUNERAL HOME', 'value': 'T.V.WILLIAMS FUNERAL HOME'},
-    {'label': 'TAYLOR FUNERAL HOME', 'value': 'TAYLOR FUNERAL HOME'},
-    {'label': 'TERRY FAMILY FUNERAL HOME', 'value': 'TERRY FAMILY FUNERAL HOME'},
-    {'label': 'TERRY FAMILY-TALBOTTON CHAPEL', 'value': 'TERRY FAMILY-TALBOTTON CHAPEL'},
-    {'label': 'THE PROMISE LAND FUNERAL HOME', 'value': 'THE PROMISE LAND FUNERAL HOME'},
-    {'label': 'THOMAS & SON HOME FOR FUNERALS', 'value': 'THOMAS & SON HOME FOR FUNERALS'},
-    {'label': 'THOMAS C. STRICKLAND & SONS FH', 'value': 'THOMAS C. STRICKLAND & SONS FH'},
-    {'label': 'THOMAS MEMORIAL F H.', 'value': 'THOMAS MEMORIAL F H.'},
-    {'label': 'THOMAS SCROGGS FUNERAL HOME', 'value': 'THOMAS SCROGGS FUNERAL HOME'},
-    {'label': 'THOMPSON-STRICKLAND- WATERS FH', 'value': 'THOMPSON-STRICKLAND- WATERS FH'},
-    {'label': 'THORNTON FUNERAL HOME', 'value': 'THORNTON FUNERAL HOME'},
-    {'label': 'TOWNS FUNERAL HOME', 'value': 'TOWNS FUNERAL HOME'},
-    {'label': 'TOWNSEND BROTHERS FUNERAL HOME', 'value': 'TOWNSEND BROTHERS FUNERAL HOME'},
-    {'label': 'TRINITY FUNERAL HOME', 'value': 'TRINITY FUNERAL HOME'},
-    {'label': 'UNITY FUNERAL HOME', 'value': 'UNITY FUNERAL HOME'},
-    {'label': 'UNITY FUNERAL HOME', 'value': 'UNITY FUNERAL HOME'},
-    {'label': 'VANCE-BROOKS - COLUMBUS', 'value': 'VANCE-BROOKS - COLUMBUS'},
-    {'label': 'VANCE-BROOKS - PHENIX CITY', 'value': 'VANCE-BROOKS - PHENIX CITY'},
-    {'label': 'VANN FUNERAL HOME', 'value': 'VANN FUNERAL HOME'},
-    {'label': 'VIDALIA FUNERAL HOME', 'value': 'VIDALIA FUNERAL HOME'},
-    {'label': 'VINCENT R. DRUMMER FH', 'value': 'VINCENT R. DRUMMER FH'},
-    {'label': 'VINES FUNERAL HOME', 'value': 'VINES FUNERAL HOME'},
-    {'label': 'W.D. LEMON & SONS FUNERAL HOME', 'value': 'W.D. LEMON & SONS FUNERAL HOME'},
-    {'label': 'WAINWRIGHT & PARLOR FUNERAL FH', 'value': 'WAINWRIGHT & PARLOR FUNERAL FH'},
-    {'label': "WARD'S FUNERAL HOME", 'value': "WARD'S FUNERAL HOME"},
-    {'label': 'WARREN FUNERAL SERVICES', 'value': 'WARREN FUNERAL SERVICES'},
-    {'label': 'WATKINS FUNERAL HOME INC.', 'value': 'WATKINS FUNERAL HOME INC.'},
-    {'label': 'WATKINS FUNERAL HOME MCDONOUGH', 'value': 'WATKINS FUNERAL HOME MCDONOUGH'},
-    {'label': 'WATKINS MORTUARY, INC.', 'value': 'WATKINS MORTUARY, INC.'},
-    {'label': 'WATSON-HUNT FUNERAL HOME', 'value': 'WATSON-HUNT FUNERAL HOME'},
-    {'label': 'WATSON-MATHEWS FUNERAL HOME', 'value': 'WATSON-MATHEWS FUNERAL HOME'},
-    {'label': 'WAY - WATSON FUNERAL HOME', 'value': 'WAY - WATSON FUNERAL HOME'},
-    {'label': 'WAY- WATSON FUNERAL HOME-BV', 'value': 'WAY- WATSON FUNERAL HOME-BV'},
-    {'label': 'WELCH & BRINKLEY MORTUARY', 'value': 'WELCH & BRINKLEY MORTUARY'},
-    {'label': 'WEST COBB FUNERAL HOME', 'value': 'WEST COBB FUNERAL HOME'},
-    {'label': 'WEST MORTUARY, INC.- A', 'value': 'WEST MORTUARY, INC.- A'},
-    {'label': "WEST'S MORTUARY - M", 'value': "WEST'S MORTUARY - M"},
-    {'label': 'WESTON FUNERAL HOME', 'value': 'WESTON FUNERAL HOME'},
-    {'label': 'WHIDDON-SHIVER FUNERAL HOME', 'value': 'WHIDDON-SHIVER FUNERAL HOME'},
-    {'label': 'WHITE CHAPEL FUNERAL HOME', 'value': 'WHITE CHAPEL FUNERAL HOME'},
-    {'label': 'WHITE FUNERAL & CREMATIONS', 'value': 'WHITE FUNERAL & CREMATIONS'},
-    {'label': 'WILLIAMS FUNERAL HOME', 'value': 'WILLIAMS FUNERAL HOME'},
-    {'label': 'WILLIAMS FUNERAL HOME - GRACE.', 'value': 'WILLIAMS FUNERAL HOME - GRACE.'},
-    {'label': 'WILLIAMS MORTUARY', 'value': 'WILLIAMS MORTUARY'},
-    {'label': 'WILLIAMS-WESTBERRY FUNERAL HOM', 'value': 'WILLIAMS-WESTBERRY FUNERAL HOM'},
-    {'label': 'WILLIE A WATKINS FH - CAROL', 'value': 'WILLIE A WATKINS FH - CAROL'},
-    {'label': 'WILLIE A WATKINS FH- RIVERDALE', 'value': 'WILLIE A WATKINS FH- RIVERDALE'},
-    {'label': 'WILLIE WATKINS F.H.-LITHONIA', 'value': 'WILLIE WATKINS F.H.-LITHONIA'},
-    {'label': 'WILLIE WATKINS FH - DOUG', 'value': 'WILLIE WATKINS FH - DOUG'},
-    {'label': "WILLIFORD'S FUNERAL HOME", 'value': "WILLIFORD'S FUNERAL HOME"},
-    {'label': 'WILLIS-JAMERSON-BRASWELL FH', 'value': 'WILLIS-JAMERSON-BRASWELL FH'},
-    {'label': 'WILSON FUNERAL HOME', 'value': 'WILSON FUNERAL HOME'},
-    {'label': 'WIMBERLY FUNERAL HOME', 'value': 'WIMBERLY FUNERAL HOME'},
-    {'label': 'WINNS FUNERAL HOME', 'value': 'WINNS FUNERAL HOME'}
-]
+# Customer names as entered; CUSTOMER_NAMES below is the normalized list used by the app
+_RAW_CUSTOMER_NAMES = (
+    'A.S. TURNER & SON FUNERAL HOME',
+    'ABBEY FUNERAL HOME',
+    'ADAMS FUNERAL HOME',
+    'AKINS-COBB FUNERALS&CREMATIONS',
+    'AL HALL FUNERAL DIRECTORS, INC.',
+    'ALABAMA HERITAGE FUNERAL HOME',
+    'ALBRITTENS FUNERAL SERVICE',
+    'ALBRITTON FUNERAL DIRECTORS',
+    'ALDRIDGE FUNERAL SERVICES',
+    'ALLEN & ALLEN FUNERAL HOME',
+    'ALLEN FUNERAL HOME',
+    'ALLISON MEMORIAL CHAPEL',
+    'ANDERSON & MARSHALL FUNERAL HM',
+    'ANGEL HEIGHTS FUNERAL HOME',
+    'ARCHER FUNERAL HOME',
+    "ARMOUR'S MEMORIAL FUNERAL HOME",
+    "ASHLEY'S JH WILLIAMS & SONS FH",
+    'BAKER FUNERAL HOME-',
+    'BAKER FUNERAL HOME.',
+    'BALDWIN FUNERAL HOME',
+    'BANKS FUNERAL HOME',
+    'BARNUM FUNERAL HOME',
+    'BATTLE & BATTLE FUNERAL HOME',
+    'BEGGS FUNERAL HOME',
+    'BEGGS FUNERAL HOME, INC.',
+    'BEGGS FUNERAL HOME, INC."',
+    'BENTLEY AND SONS FUNERAL HOME',
+    'BENTLEY CARSON MEMORIAL FH',
+    "BENTLEY'S & SON FUNERAL HOME",
+    'BENTLEYS FUNERAL HOME',
+    'BEVIS FUNERAL HOME',
+    'BOONE FUNERAL HOME',
+    'BOWEN-DONALDSON FH',
+    'BRADLEY ANDERSON FUNERAL HOME',
+    'BRADWELL MORTUARY',
+    'BRANNEN FAMILY FUNERAL SERVICE',
+    'BRANNEN-NESMITH FUNERAL HOME',
+    'BRIDGES FUNERAL HOME',
+    "BROCK'S HOMETOWN FUNERAL HOME",
+    'BROOKSIDE FUNERAL HOME',
+    'BRUTON MORTUARY',
+    'BRYANT FUNERAL HOME',
+    "BURDEN'S FUNERAL HOME",
+    'BURTON FUNERAL HOME',
+    'BYRD & FLANIGAN FUNERAL HOME',
+    'C.O. HOLLOWAY MORTUARY',
+    'CARL WILLIAMS FUNERAL DIRECTORS',
+    'CARSON McLANE FUNERAL HOME',
+    'CARTER FUNERAL HOME',
+    'CARTER FUNERAL HOME.',
+    'CARTER OGLETHORPE CHAPEL',
+    'CELEBRATION OF LIFE MEMORIAL',
+    'CENTRAL FUNERAL HOME',
+    "CHANDLER'S FUNERAL HOME",
+    'CHAPEL HILL MORTUARY',
+    'CHAPMAN FUNERAL CHAPEL',
+    'CHAPMAN FUNERAL HOME',
+    'CHARLES MCDOUGALD FUNERAL HOME',
+    'CHARLES McCLELLAN FUNERAL HOME',
+    'CLARK FUNERAL HOME',
+    'CLARK FUNERAL HOME-',
+    'CLARK MEMORIAL FUNERAL SERVICE',
+    'CLAUDE A. MCKIBBEN & SONS FH',
+    'CLAYTON MEMORIAL CHAPEL',
+    'CLOUD FUNERAL HOME',
+    'CM BROWN FUNERAL HOME',
+    'COBB FUNERAL CHAPEL',
+    'COES FUNERAL HOME',
+    'COGGINS FUNERAL HOME',
+    'COLLINS FUNERAL HOME',
+    'COLONIAL FUNERAL HOME',
+    'COLQUITT FUNERAL HOME',
+    'COMMUNITY FUNERAL HOME',
+    'CONNER-WESTBERRY FUNERAL HOME',
+    'COX-IVEY FUNERAL HOME',
+    'CRAIG R. TREMBLE FUNERAL HOME-',
+    'CRAWFORD & MOULTRY FH',
+    'CROSBY FUNERAL HOME-',
+    'CURTIS FUNERAL HOME',
+    'DEAL FUNERAL DIRECTORS',
+    'D.A.E. ENTERPRISE, LLC',
+    'DARRELL E WATKINS FUNERAL HOME',
+    'DAVIS FUNERAL HOME',
+    'DAVIS MEMORIAL MORTUARY',
+    'DILLARD FUNERAL HOME',
+    'DIVINE MORTUARY & CREMATIONS',
+    'DONALD TRIMBLE MORTUARY, INC.',
+    'DORCHESTER FUNERAL HOME',
+    'DUDLEY FUNERAL HOME',
+    'E.T. HOSLEY MEMORIAL',
+    'EDWARDS-SMALL MORTUARY',
+    'ELLIOTT FUNERAL HOME',
+    'ELLIOTT PARHAM MORTUARY',
+    'ELLISON MEMORIAL FUNERAL HOME',
+    'ERIC BROWN FUNERAL HOME',
+    'EVANS-SKIPPER FUNERAL HOME',
+    'F.L. SIMS FUNERAL HOME',
+    'FAITH FUNERAL HOME',
+    'FAMILY FIRST FUNERAL CARE',
+    'FAMILY FUNERAL HOME',
+    'FERGUSON FUNERAL HOME',
+    'FIELDS FUNERAL HOME',
+    'FLANDERS MORRISON FUNERAL HOME',
+    'FLANIGAN FUNERAL HOME',
+    'FORD-STEWART FUNERAL HOME',
+    'FRAZIER AND SON FUNERAL HOME',
+    'FREDERICK-DEAN FUNERAL HOME',
+    'FREEMAN FUNERAL HOME',
+    'FUQUA - BANKSTON FUNERAL HOME',
+    'GARDENS OF MEMORY-BAINBRIDGE',
+    'GATLIN MORTUARY INC.',
+    'GETHSEMANE MEMORIALS',
+    'GLOVER MORTUARY',
+    'GODFREY FUNERAL HOME, LLC',
+    'GOLDEN GATES BURIAL& CREMATION',
+    'GRACE FUNERAL & CREMATION SVCS',
+    'GREEN HILLS FUNERAL HOME',
+    'GREG HANCOCK FUNERAL CHAPEL',
+    'GREGORY B. LEVETT & SONS FH',
+    'GROOMS FUNERAL HOME',
+    'GRUBBS FUNERAL HOME',
+    'GUERRY FUNERAL HOME',
+    "GUS THORNHILL'S FUNERAL HOME",
+    "HADLEY'S FUNERAL HOME",
+    'HAGAN FUNERAL SERVICE',
+    'HAILE FUNERAL HOME',
+    'HAISTEN FUNERAL HOME',
+    'HALL & HALL FUNERAL HOME',
+    'HALLS FUNERAL HOME',
+    'HAMILTON-BURCH FH',
+    'HAMMOND FUNERAL HOME',
+    'HANCOCK FUNERAL HOME',
+    'HARRELLS FUNERAL HOME',
+    'HARRINGTON FAMILY FS- WAYCROSS',
+    'HARRINGTON FUNERAL HOME',
+    'HARRINGTON MORTUARY &CREMATION',
+    'HARRIS MORTUARY, INC.',
+    'HART FUNERAL HOME',
+    'HARVEY FUNERAL HOME',
+    'HATCHER-PEOPLES FUNERAL HOME',
+    "HENDERSON'S MEMORIAL CHAPEL",
+    'HERITAGE FUNERAL HOME',
+    'HERITAGE FUNERAL HOME-',
+    'HERSCHEL THORNTON MORTUARY',
+    'HICKS & SONS MORTUARY',
+    'HICKS FUNERAL HOME',
+    'HIGGINS FUNERAL HOME',
+    'HIGGS FUNERAL HOME',
+    'HILL-WATSON MEMORIAL CHAPEL',
+    'HILL-WATSON-PEOPLES FUNERAL HM',
+    'HILLS FUNERAL HOME',
+    'HOLMAN FUNERAL HOME-OZARK',
+    'HOLMAN-HEADLAND MORTUARY. INC',
+    'HOPKINS MORTUARY',
+    'HOUSE OF TOWNS MORTUARY',
+    'HOWARD FUNERAL HOME',
+    "HUFF'S INTERNATIONAL FH",
+    'HUNTER-ALLEN-MYHAND FH',
+    'HUTCHESON-CROFT FUNERAL HOME',
+    "HUTCHESON'S MEMORIAL CHAPEL",
+    'INDEPENDENT FUNERAL HOME',
+    'IVEY FUNERAL HOME',
+    'IVIE FUNERAL HOME',
+    'J. COLLINS FUNERAL HOME',
+    'J.L. LITMAN FUNERAL SERVICE',
+    'J.MELLIE NESMITH FH',
+    'J.W. WILLIAMS FUNERAL HOME',
+    'JAMES & LIPFORD FUNERAL HOME',
+    'JAMES & SIKES FUNERAL HOMES',
+    'JAMES A. THOMAS F H',
+    'JANAZA SERVICES OF GA INC.',
+    'JEFF JONES FUNERAL HOME',
+    'JEFFCOAT - TRANT FUNERAL HOME',
+    'JEFFCOAT FUNERAL HOME',
+    'JH WILLIAMS AND SONS INC.',
+    'JOHNSON & SON FUNERAL SERVICE',
+    'JOHNSON BROWN SERVICE FH',
+    'JOHNSON FUNERAL & CREMATION',
+    'JOINER-ANDERSON FUNERAL HOME',
+    'JONES BROTHERS MEMORIAL CHAPEL',
+    'JORDAN FUNERAL HOME',
+    'JOSEPH W. JONES FUNERAL HOME',
+    'JP MOORE MORTUARY & CREMATION',
+    'K.L. CLOSE FUNERAL HOME',
+    'KIMBRELL-STERN FD',
+    'KIMBROUGH FUNERAL HOME',
+    'KING BROTHERS FUNERAL HOME',
+    'KURT DEAL FUNERAL',
+    'LAKES-DUNSON-ROBERTSON FH',
+    'LAKEVIEW MEMORY GARDENS',
+    "LAMB'S INTERNATIONAL FH",
+    'LANE MEMORIAL CHAPEL',
+    'LEAK-MEMORY FH/ LOC 4338',
+    'LEES FUNERAL HOME & CREMATORY',
+    'LEMON FUNERAL HOME',
+    'LEONARD FUNERAL HOME',
+    'LESTER LACKEY AND SONS FH',
+    'LEWIS MORTUARY',
+    'LIFESONG FUNERAL HOME',
+    'LINVILLE MEMORIAL FUNERAL HOME',
+    'LITTLE-WARD FUNERAL HOME',
+    'LOVEIN FUNERAL HOME',
+    'LOWE FUNERAL HOME',
+    'LUKE STRONG & SON MORTUARY',
+    'LUNSFORD FUNERAL HOME',
+    'M.D. WALKER FUNERAL HOME',
+    'MACKY WILSON JENNINGS FH',
+    'MAGNOLIA CREMATIONS',
+    'MANRY JORDAN HODGES FH',
+    'MARIANNA CHAPEL FUNERAL HOME',
+    'MARIETTA FUNERAL HOME',
+    'MARTIN LUTHER KING MEMORIAL',
+    'MATHEWS FUNERAL HOME',
+    'MAX BRANNON & SONS FH',
+    'MAY & SMITH FUNERAL DIRECTORS',
+    'MCALPIN FUNERAL HOME',
+    'MCCOY FUNERAL HOME-MANCHESTER',
+    'MCCULLOUGH FUNERAL HOME',
+    'McIVER FUNERAL HOME',
+    "MCKENZIE'S FUNERAL HOME",
+    'MCKOON FUNERAL HOME',
+    'MCMULLEN FUNERAL HOME',
+    'MEADOWS FUNERAL HOME',
+    'MEADOWS FUNERAL HOME, INC.',
+    'MEMORY CHAPEL FUNERAL HOME',
+    'MILES FUNERAL HOME',
+    'MILES-ODUM FUNERAL HOME',
+    'MILLER FUNERAL HOME TALLAPOOSA',
+    'MONROE COUNTY MEMORIAL CHAPEL',
+    'MOODY-DANIEL FUNERAL HOME',
+    'MOORE FUNERAL HOME',
+    "MORGAN & SON'S FUNERAL HOME",
+    'MORGAN & SONS FUNERAL HOME',
+    'MUSIC FUNERAL HOME',
+    'MUSIC FUNERAL HOME -',
+    "NELSON'S MEMORIAL MORTUARY",
+    'NEW GENERATION MEMORIAL MORT.',
+    'NOBLES FUNERAL HOME & CREMATORY',
+    'OGLETHORPE FUNERAL CHAPEL',
+    'OXLEY-HEARD FUNERAL DIRECTORS',
+    'PARKER - BRAMLETT FUNERAL HOME',
+    'PARROTT FUNERAL HOME',
+    'PASCHAL MEMORIAL FUNERAL HOME',
+    'PASCO GAINER SR. FUNERAL HOME',
+    'PAULK FUNERAL HOME',
+    'PEARSON - DIAL FUNERAL HOME',
+    "PEEL' FUNERAL HOME",
+    'PEOPLES FUNERAL HOME',
+    "PEOPLES' FUNERAL HOME- T",
+    'PERKINS FUNERAL HOME',
+    'PERRY BROTHERS FUNERAL HOME',
+    'PERRY FUNERAL CHAPEL',
+    'PETERSON & WILLIAMS FH',
+    "PETERSON'S FUNERAL HOME",
+    'PHILLIPS & RILEY FUNERAL HOME',
+    'POOLE FUNERAL HOME & CREMATION',
+    'PROGRESSIVE FUNERAL HOME',
+    'PROMISE LAND FUNERAL HOME',
+    'RADNEY FUNERAL HOME',
+    'RAINEY FUNERAL HOME',
+    'RAINGE MEMORIAL CHAPEL',
+    'RAINWATER FUNERAL HOME',
+    'REECE FUNERAL HOME',
+    'RELIHAN FUNERAL HOME',
+    'RICHARDSON FUNERAL HOME',
+    "RICHARDSON'S FAMILY FUNERAL CA",
+    'RICHMOND HILL FUNERAL HOME',
+    'RICKETSON FUNERAL HOME',
+    "RIDOUT'S PRATTVILLE CHAPEL",
+    'RINEHART & SONS FUNERAL HOME',
+    'ROLLINS FUNERAL HOME',
+    'RONNIE L. STEWART FS',
+    'ROOKS FUNERAL HOME',
+    'ROSADALE FUNERAL PARLOR, INC.',
+    'ROSCOE JENKINS FUNERAL HOME',
+    'ROSS - CLAYTON FUNERAL HOME',
+    'ROYAL FUNERAL HOME',
+    'RUSSELL WRIGHT MORTUARY',
+    'SAMMONS FUNERAL HOME',
+    'SCONIERS FUNERAL HOME',
+    'SCOTT & ROBERTS FUNERAL HOME',
+    'SELMA FUNERAL HOME',
+    'SERENITY FUNERAL HOME',
+    'SEROYER FUNERAL HOME',
+    'SHEPARD- ROBERSON FUNERAL HOME',
+    'SHERRELL-WESTBERRY FUNERAL HOM',
+    "SHIPP'S FUNERAL HOME",
+    'SIMS FUNERAL HOME',
+    'SIMS FUNERAL HOME -',
+    'SMITH FUNERAL HOME',
+    'SO. CREMATIONS AT HOLLY HILL',
+    'SONJA COAXUM',
+    'SOUTHERN HERITAGE FUNERAL HOME',
+    'SOUTHERN MEMORIAL FH',
+    'SOUTHVIEW MORTUARY',
+    'SPAULDING & BARNES FH',
+    'STANFORD MEMORIAL CHAPEL',
+    'STANLEY FUNERAL HOME',
+    'STEVENS FUNERAL HOME',
+    'STEVENS-MCGHEE FUNERAL HOME',
+    'STOKES - SOUTHERLAND F.H.',
+    'STOVALL FUNERAL HOME',
+    'STRIFFLER - HAMBY MORTUARY',
+    'STRIFFLER-HAMBY MORTUARY',
+    'STRONG & JONES FUNERAL HOME',
+    'SUNSET MEMORIAL PARK',
+    "SWAIN'S FUNERAL HOME",
+    'T.J. BEGGS JR. & SONS FH',
+    'T.V.WILLIAMS FUNERAL HOME',
+    'TAYLOR FUNERAL HOME',
+    'TERRY FAMILY FUNERAL HOME',
+    'TERRY FAMILY-TALBOTTON CHAPEL',
+    'THE PROMISE LAND FUNERAL HOME',
+    'THOMAS & SON HOME FOR FUNERALS',
+    'THOMAS C. STRICKLAND & SONS FH',
+    'THOMAS MEMORIAL F H.',
+    'THOMAS SCROGGS FUNERAL HOME',
+    'THOMPSON-STRICKLAND- WATERS FH',
+    'THORNTON FUNERAL HOME',
+    'TOWNS FUNERAL HOME',
+    'TOWNSEND BROTHERS FUNERAL HOME',
+    'TRINITY FUNERAL HOME',
+    'UNITY FUNERAL HOME',
+    'VANCE-BROOKS - COLUMBUS',
+    'VANCE-BROOKS - PHENIX CITY',
+    'VANN FUNERAL HOME',
+    'VIDALIA FUNERAL HOME',
+    'VINCENT R. DRUMMER FH',
+    'VINES FUNERAL HOME',
+    'W.D. LEMON & SONS FUNERAL HOME',
+    'WAINWRIGHT & PARLOR FUNERAL FH',
+    "WARD'S FUNERAL HOME",
+    'WARREN FUNERAL SERVICES',
+    'WATKINS FUNERAL HOME INC.',
+    'WATKINS FUNERAL HOME MCDONOUGH',
+    'WATKINS MORTUARY, INC.',
+    'WATSON-HUNT FUNERAL HOME',
+    'WATSON-MATHEWS FUNERAL HOME',
+    'WAY - WATSON FUNERAL HOME',
+    'WAY- WATSON FUNERAL HOME-BV',
+    'WELCH & BRINKLEY MORTUARY',
+    'WEST COBB FUNERAL HOME',
+    'WEST MORTUARY, INC.- A',
+    "WEST'S MORTUARY - M",
+    'WESTON FUNERAL HOME',
+    'WHIDDON-SHIVER FUNERAL HOME',
+    'WHITE CHAPEL FUNERAL HOME',
+    'WHITE FUNERAL & CREMATIONS',
+    'WILLIAMS FUNERAL HOME',
+    'WILLIAMS FUNERAL HOME - GRACE.',
+    'WILLIAMS MORTUARY',
+    'WILLIAMS-WESTBERRY FUNERAL HOM',
+    'WILLIE A WATKINS FH - CAROL',
+    'WILLIE A WATKINS FH- RIVERDALE',
+    'WILLIE WATKINS F.H.-LITHONIA',
+    'WILLIE WATKINS FH - DOUG',
+    "WILLIFORD'S FUNERAL HOME",
+    'WILLIS-JAMERSON-BRASWELL FH',
+    'WILSON FUNERAL HOME',
+    'WIMBERLY FUNERAL HOME',
+    'WINNS FUNERAL HOME',
+)
+
+# Normalized, de-duplicated and sorted once at load; doubles as the dropdown options
+CUSTOMER_NAMES = tuple(sorted({name.strip().upper() for name in _RAW_CUSTOMER_NAMES}))
+
+# Membership set for the customer name list; built once since the list never changes
+CUSTOMER_NAMES_SET = frozenset(CUSTOMER_NAMES)
+CUSTOMER_AUTOCOMPLETE_LIMIT = 20
+
+
+# Server-side customer autocomplete by name prefix
+@app.route('/api/customer_autocomplete')
+@local_or_authenticated
+def customer_autocomplete():
+    prefix = request.args.get('q', '').strip().upper()
+    if not prefix:
+        return jsonify([])
+
+    # Matches form a contiguous run in the sorted names, starting at the bisection point
+    start = bisect.bisect_left(CUSTOMER_NAMES, prefix)
+    matches = []
+    for name in islice(CUSTOMER_NAMES, start, None):
+        if not name.startswith(prefix) or len(matches) >= CUSTOMER_AUTOCOMPLETE_LIMIT:
+            break
+        matches.append(name)
+    return jsonify(matches)
+
+
 # Application layout with navigation
 dash_app.layout = html.Div([
     dcc.Location(id='url', refresh=False),
@@ -711,18 +986,28 @@ dash_app.layout = html.Div([
 
 # Home Page Layout
 def home_layout():
+    return _home_layout(get_inventory_version())
+
+
+# Layouts only change with the inventory, so the component tree is built once per inventory version
+@lru_cache(maxsize=4)
+def _home_layout(version):
     inventory = get_inventory_from_db()
-    product_names = sorted(set(item['product_name'] for item in inventory))
-    product_options = [{'label': name, 'value': name} for name in product_names]
+    for item in inventory:
+        item['add_quantity'] = ''
+    product_names = get_product_names()
 
     return dbc.Container([
+        # Full inventory for clientside search; rewritten by the server only after inventory changes
+        dcc.Store(id='inventory-store', data=inventory),
+
         # Existing search bar
         dbc.Row([
             dbc.Col([
                 html.Label("Search by Product Name"),
                 dcc.Dropdown(
                     id='inventory-search',
-                    options=product_options,
+                    options=product_names,
                     placeholder='Type to search...',
                     clearable=True,
                     searchable=True,
@@ -741,7 +1026,7 @@ def home_layout():
                         {"name": "Quantity", "id": "quantity"},
                         {"name": "Add Quantity", "id": "add_quantity", "type": 'numeric', "editable": True},
                     ],
-                    data=[{**item, 'add_quantity': ''} for item in inventory],
+                    data=inventory,
                     style_data_conditional=[
                         {
                             'if': {
@@ -805,118 +1090,130 @@ def home_layout():
     ], fluid=True)
 
 
-# Combined callback for inventory management
+# Parse a whole, non-negative number from user input without raising; returns None if it isn't one
+def _parse_nonneg_int(value):
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)  # Numeric inputs may arrive as e.g. 3.0
+    text_value = str(value).strip()
+    return int(text_value) if text_value.isascii() and text_value.isdigit() else None
+
 
+# Inventory management callbacks: writes refresh 'inventory-store', and the clientside filter redraws the table
 
+
+# Callback to add a new casket from the Add Casket form
 @dash_app.callback(
-    [Output('inventory-table', 'data'),
-     Output('add-casket-message', 'children')],
-    [Input('inventory-table', 'data_timestamp'),
-     Input('add-casket-button', 'n_clicks'),
-     Input('inventory-search', 'value')],
-    [State('inventory-table', 'data'),
-     State('inventory-table', 'data_previous'),
-     State('new-casket-name', 'value'),
-     State('new-casket-quantity', 'value')]
+    [Output('inventory-store', 'data', allow_duplicate=True),
+     Output('add-casket-message', 'children', allow_duplicate=True)],
+    [Input('add-casket-button', 'n_clicks')],
+    [State('new-casket-name', 'value'),
+     State('new-casket-quantity', 'value')],
+    prevent_initial_call=True
 )
-def manage_inventory(timestamp, add_button_clicks, search_value, current_data, previous_data, new_casket_name, new_quantity):
-    ctx = callback_context
-    if not ctx.triggered:
+def add_casket(add_button_clicks, new_casket_name, new_quantity):
+    if not add_button_clicks:
         return no_update, no_update
+    if not new_casket_name:
+        return no_update, dbc.Alert("Please enter a casket name.", color="danger")
 
-    triggered_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    session = Session()
+    quantity = _parse_nonneg_int(new_quantity) if new_quantity else 0
+    if quantity is None:
+        if str(new_quantity).strip().startswith('-'):
+            return no_update, dbc.Alert("Quantity cannot be negative.", color="danger")
+        return no_update, dbc.Alert("Please enter a valid quantity.", color="danger")
+    new_quantity = quantity
 
+    session = Session()
     try:
-        # Handle Add Casket button click
-        if triggered_id == 'add-casket-button' and add_button_clicks:
-            if not new_casket_name:
-                return no_update, dbc.Alert("Please enter a casket name.", color="danger")
+        # Take the write lock before the existence check so two adds of the same name can't both pass it
+        session.connection(execution_options={'sqlite_immediate': True})
 
-            try:
-                new_quantity = int(new_quantity) if new_quantity else 0
-                if new_quantity < 0:
-                    return no_update, dbc.Alert("Quantity cannot be negative.", color="danger")
-            except ValueError:
-                return no_update, dbc.Alert("Please enter a valid quantity.", color="danger")
-
-            # Check if casket already exists
-            existing_casket = session.query(Inventory).filter_by(product_name=new_casket_name).first()
-            if existing_casket:
-                return no_update, dbc.Alert(f"Casket '{new_casket_name}' already exists in inventory.", color="warning")
-
-            # Add new casket
-            new_casket = Inventory(
-                product_name=new_casket_name,
-                quantity=new_quantity,
-                barcode=None
-            )
-            session.add(new_casket)
-            session.commit()
+        # Check if casket already exists; read from the DB, as the cache can miss recent writes
+        existing_casket = session.query(Inventory.id).filter_by(product_name=new_casket_name).first()
+        if existing_casket:
+            session.rollback()
+            return no_update, dbc.Alert(f"Casket '{new_casket_name}' already exists in inventory.", color="warning")
+
+        # Add new casket
+        new_casket = Inventory(
+            product_name=new_casket_name,
+            quantity=new_quantity,
+            barcode=None
+        )
+        session.add(new_casket)
+        session.commit()
 
-            # Publish update to MQTT
-            publish_to_mqtt('add', {
-                'product_name': new_casket_name,
-                'quantity': new_quantity
-            })
+        # Publish update to MQTT
+        publish_to_mqtt('add', {
+            'product_name': new_casket_name,
+            'quantity': new_quantity
+        })
 
-            # Get updated inventory data
-            updated_inventory = get_inventory_from_db()
-            updated_data = [{**item, 'add_quantity': ''} for item in updated_inventory]
-
-            return updated_data, dbc.Alert(f"Casket '{new_casket_name}' added successfully!", color="success")
-
-        # Handle quantity updates in the inventory table
-        elif triggered_id == 'inventory-table' and current_data and previous_data:
-            updates_made = False
-            for new_row, old_row in zip(current_data, previous_data):
-                add_quantity = new_row.get('add_quantity', '')
-                if add_quantity and add_quantity != old_row.get('add_quantity', ''):
-                    try:
-                        add_value = int(float(add_quantity))  # Handle both integer and decimal inputs
-                        if add_value < 0:
-                            continue
-
-                        product_name = new_row['product_name']
-                        inventory_item = session.query(Inventory).filter_by(product_name=product_name).first()
-
-                        if inventory_item:
-                            inventory_item.quantity += add_value
-                            new_row['quantity'] = inventory_item.quantity
-                            new_row['add_quantity'] = ''
-                            updates_made = True
-
-                            # Publish update to MQTT
-                            publish_to_mqtt('update', {
-                                'product_name': product_name,
-                                'quantity': inventory_item.quantity
-                            })
-                    except (ValueError, TypeError):
-                        continue
-
-            if updates_made:
-                session.commit()
-                return current_data, no_update
-
-        # Handle search filtering
-        elif triggered_id == 'inventory-search':
-            if search_value:
-                inventory_item = session.query(Inventory).filter_by(product_name=search_value).first()
-                if inventory_item:
-                    filtered_data = [{
-                        "product_name": inventory_item.product_name,
-                        "quantity": inventory_item.quantity,
-                        "add_quantity": ''
-                    }]
-                    return filtered_data, no_update
-                return [], no_update
-            else:
-                updated_inventory = get_inventory_from_db()
-                full_data = [{**item, 'add_quantity': ''} for item in updated_inventory]
-                return full_data, no_update
+        # Get updated inventory data
+        return get_inventory_from_db(), dbc.Alert(f"Casket '{new_casket_name}' added successfully!", color="success")
+
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.error(f"Database error in inventory management: {e}")
+        return no_update, dbc.Alert("A database error occurred while managing inventory.", color="danger")
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Error in inventory management: {e}")
+        return no_update, dbc.Alert("An error occurred while managing inventory.", color="danger")
+    finally:
+        session.close()
 
+
+# Callback to apply quantities entered in the table's Add Quantity column
+@dash_app.callback(
+    [Output('inventory-store', 'data', allow_duplicate=True),
+     Output('add-casket-message', 'children', allow_duplicate=True)],
+    [Input('inventory-table', 'data_timestamp')],
+    [State('inventory-table', 'data'),
+     State('inventory-table', 'data_previous')],
+    prevent_initial_call=True
+)
+def update_table_on_edit(timestamp, current_data, previous_data):
+    if not current_data or not previous_data:
         return no_update, no_update
 
+    # Set difference of (product, Add Quantity) pairs finds the edited cells without a per-row diff
+    new_cells = {(row['product_name'], row.get('add_quantity', '')) for row in current_data}
+    old_cells = {(row['product_name'], row.get('add_quantity', '')) for row in previous_data}
+    edited = {}
+    for name, add_quantity in new_cells - old_cells:
+        if add_quantity:
+            add_value = _parse_nonneg_int(add_quantity)
+            if add_value is not None:
+                edited[name] = add_value
+
+    if not edited:
+        return no_update, no_update
+
+    session = Session()
+    try:
+        # Load all edited products in one query
+        inventory_items = {
+            item.product_name: item
+            for item in session.query(Inventory).filter(Inventory.product_name.in_(edited)).all()
+        }
+
+        updates = []
+        for product_name, add_value in edited.items():
+            inventory_item = inventory_items.get(product_name)
+            if inventory_item:
+                inventory_item.quantity += add_value
+                updates.append({'product_name': product_name, 'quantity': inventory_item.quantity})
+
+        if not updates:
+            return no_update, no_update
+
+        session.commit()
+        # Publish updates to MQTT
+        publish_to_mqtt('bulk_update', updates)
+        # Reloads the expired cache; the clientside filter redraws the table from the store
+        return get_inventory_from_db(), no_update
+
     except SQLAlchemyError as e:
         session.rollback()
         logger.error(f"Database error in inventory management: {e}")
@@ -929,10 +1226,43 @@ def manage_inventory(timestamp, add_button_clicks, search_value, current_data, p
         session.close()
 
 
+# Client-side callback to filter the inventory table: exact product match, else a capped
+# case-insensitive prefix match; runs in the browser, so searching never hits the server
+dash_app.clientside_callback(
+    """
+    function(searchValue, inventory) {
+        var rows = inventory || [];
+        if (searchValue) {
+            var exact = rows.filter(function(row) { return row.product_name === searchValue; });
+            if (exact.length) {
+                rows = exact;
+            } else {
+                var prefix = searchValue.toLowerCase();
+                rows = rows.filter(function(row) {
+                    return (row.product_name || '').toLowerCase().startsWith(prefix);
+                }).slice(0, 50);
+            }
+        }
+        return rows.map(function(row) {
+            return {product_name: row.product_name, quantity: row.quantity, add_quantity: ''};
+        });
+    }
+    """,
+    Output('inventory-table', 'data', allow_duplicate=True),
+    [Input('inventory-search', 'value'),
+     Input('inventory-store', 'data')],
+    prevent_initial_call=True
+)
+
+
 # Orders Page Layout
 def orders_layout():
-    inventory = get_inventory_from_db()
-    casket_options = [{'label': item['product_name'], 'value': item['product_name']} for item in inventory]
+    return _orders_layout(get_inventory_version())
+
+
+@lru_cache(maxsize=4)
+def _orders_layout(version):
+    casket_options = get_casket_options()
 
     return dbc.Container([
         dbc.Row([
@@ -945,8 +1275,10 @@ def orders_layout():
                 html.Label("Select Customer"),
                 dcc.Dropdown(
                     id='customer-dropdown',
-                    options=customer_options,
+                    options=CUSTOMER_NAMES,
                     placeholder="Select a customer",
+                    optionHeight=30,
+                    maxHeight=200,
                     style={'width': '100%'}
                 ),
             ], width=4),
@@ -987,26 +1319,25 @@ def orders_layout():
     Output('customer-dropdown', 'options'),
     Input('url', 'pathname')
 )
+@query_budget(1)
 def update_customer_dropdown(pathname):
-    session = Session()
-    try:
-        # Get customers from CustomerInfo table
-        db_customers = [row[0].upper() for row in session.query(CustomerInfo.customer_name).all()]
+    # Predefined and saved customers, merged and sorted once per cache refresh;
+    # names double as option label and value
+    return get_all_customer_names()
 
-        # Get predefined customer options (they're already in uppercase)
-        predefined_customers = [opt['value'] for opt in customer_options]
 
-        # Combine both lists and remove duplicates
-        all_customers = sorted(set(predefined_customers) | set(db_customers))
+# Casket dropdown options, rebuilt only when the inventory version changes
+def get_casket_options():
+    return _casket_options(get_inventory_version())
 
-        # Create options list with consistent uppercase
-        combined_options = [{'label': name, 'value': name} for name in all_customers]
 
-        return combined_options
-    finally:
-        session.close()
+@lru_cache(maxsize=1)
+def _casket_options(version):
+    return tuple(item['product_name'] for item in get_inventory_from_db())
 
 
+# Order item rows are memoized; casket_options must be the (hashable) tuple from get_casket_options()
+@lru_cache(maxsize=64)
 def create_order_item(index, casket_options):
     return html.Div([
         dbc.Row([
@@ -1035,15 +1366,27 @@ def create_order_item(index, casket_options):
     ], id={'type': 'order-item', 'index': index})
 
 
+# Short-lived cache for the recent purchases layout, cleared whenever an order is confirmed
+RECENT_PURCHASES_LAYOUT_TTL = 30  # seconds
+_recent_purchases_layout_cache = {'layout': None, 'expires': 0.0}
+
+
+def clear_recent_purchases_layout_cache():
+    _recent_purchases_layout_cache['layout'] = None
+
+
 # Recent Purchases Page Layout
 def recent_purchases_layout():
-    recent_purchases = get_recent_purchases_from_db()
-    # Get unique customer names and product names for filters
-    customer_names = sorted(set(item['customer'] for item in recent_purchases))
-    product_names = sorted(set(item['product_name'] for item in recent_purchases))
+    now = time.monotonic()
+    if _recent_purchases_layout_cache['layout'] is None or now >= _recent_purchases_layout_cache['expires']:
+        _recent_purchases_layout_cache['layout'] = _recent_purchases_layout()
+        _recent_purchases_layout_cache['expires'] = now + RECENT_PURCHASES_LAYOUT_TTL
+    return _recent_purchases_layout_cache['layout']
+
 
-    customer_options = [{'label': name, 'value': name} for name in customer_names]
-    product_options = [{'label': name, 'value': name} for name in product_names]
+def _recent_purchases_layout():
+    # Get unique customer names and product names for filters; rows are loaded a page at a time
+    customer_names, product_names = get_recent_purchase_filter_options()
 
     return dbc.Container([
         dbc.Row([
@@ -1056,7 +1399,7 @@ def recent_purchases_layout():
                 html.Label("Filter by Customer"),
                 dcc.Dropdown(
                     id='customer-filter',
-                    options=customer_options,
+                    options=customer_names,
                     placeholder='Select customers...',
                     clearable=True,
                     searchable=True,
@@ -1068,7 +1411,7 @@ def recent_purchases_layout():
                 html.Label("Filter by Product Name"),
                 dcc.Dropdown(
                     id='product-filter',
-                    options=product_options,
+                    options=product_names,
                     placeholder='Select products...',
                     clearable=True,
                     searchable=True,
@@ -1088,7 +1431,14 @@ def recent_purchases_layout():
                         {"name": "Quantity", "id": "quantity"},
                         {"name": "Date Purchased", "id": "date_purchased"},
                     ],
-                    data=recent_purchases,
+                    data=[],
+                    # Paging and sorting are done in SQL by update_recent_purchases_table
+                    page_action='custom',
+                    page_current=0,
+                    page_size=RECENT_PURCHASES_PAGE_SIZE,
+                    sort_action='custom',
+                    sort_mode='single',
+                    sort_by=[],
                     style_cell={'textAlign': 'left'},
                     style_table={'width': '100%'},
                     style_data_conditional=[{
@@ -1106,13 +1456,16 @@ def recent_purchases_layout():
 
 # Stock Alerts Page Layout
 def stock_alerts_layout():
-    stock_alerts = get_stock_alerts_from_db()
-
     return dbc.Container([
         dbc.Row([
             dbc.Col(html.H2("Stock Alerts"), width=12)
         ], justify="start", style={'marginTop': '20px'}),
 
+        # Periodic check that only refreshes the table when inventory has changed; the store starts
+        # empty so the callback's initial run fills the table after the page is shown
+        dcc.Interval(id='stock-alerts-interval', interval=STOCK_ALERTS_REFRESH_MS, n_intervals=0),
+        dcc.Store(id='stock-alerts-version', data=None),
+
         dbc.Row([
             dbc.Col([
                 dash_table.DataTable(
@@ -1121,7 +1474,7 @@ def stock_alerts_layout():
                         {"name": "Product Name", "id": "product_name"},
                         {"name": "Quantity", "id": "quantity"},
                     ],
-                    data=stock_alerts,
+                    data=[],
                     style_data_conditional=[
                         {
                             'if': {
@@ -1155,149 +1508,248 @@ class CustomerInfo(Base):
     state = Column(String)
     zip_code = Column(String)
 
+    # Customer lookups filter by name
+    __table_args__ = (
+        Index('ix_customer_info_name', 'customer_name'),
+    )
+
 
 # Create the tables (if not exist)
 Base.metadata.create_all(engine)
 logger.debug("Database tables created (if not existing).")
 
+for table_index in CustomerInfo.__table__.indexes:
+    table_index.create(engine, checkfirst=True)
+logger.debug("Customer info indexes created (if not existing).")
+
+# Refresh planner statistics so SQLite picks up the indexes above
+with engine.begin() as conn:
+    conn.execute(text("ANALYZE"))
+logger.debug("Database statistics refreshed.")
+
+
+# Cache of customer names, cleared when a customer is added or updated. The lists are stored as
+# tuples and only ever replaced, so callers can iterate them while another thread updates the cache
+CUSTOMER_NAMES_TTL = 60  # seconds
+_customer_names_cache = {'names': None, 'all_names': None, 'expires': 0.0}
+_customer_names_cache_lock = threading.Lock()
+
+
+# Saved customer names, plus the order dropdown's merge of them with the predefined list
+def _load_customer_names_cache():
+    # Read-only, so a plain engine connection: no ORM session or row objects for a throw-away list
+    with engine.connect() as conn:
+        names = conn.execute(select(CustomerInfo.customer_name).order_by(CustomerInfo.customer_name)).scalars().all()
+    _customer_names_cache['names'] = tuple(names)
+    _customer_names_cache['all_names'] = tuple(sorted(CUSTOMER_NAMES_SET.union(name.upper() for name in names)))
+    _customer_names_cache['expires'] = time.monotonic() + CUSTOMER_NAMES_TTL
+
+
+def _get_customer_names_entry(key):
+    with _customer_names_cache_lock:
+        if _customer_names_cache[key] is None or time.monotonic() >= _customer_names_cache['expires']:
+            _load_customer_names_cache()
+        return _customer_names_cache[key]
+
+
+# Names saved in the CustomerInfo table, sorted
+def get_customer_names():
+    return _get_customer_names_entry('names')
+
+
+# Predefined and saved customer names combined, uppercased and sorted
+def get_all_customer_names():
+    return _get_customer_names_entry('all_names')
+
+
+def clear_customer_names_cache():
+    with _customer_names_cache_lock:
+        _customer_names_cache['names'] = None
+        _customer_names_cache['all_names'] = None
+
+
+# Add a newly saved (already uppercased) customer to the cached lists in sorted position,
+# instead of reloading them
+def add_to_customer_names_cache(name):
+    with _customer_names_cache_lock:
+        for key in ('names', 'all_names'):
+            names = _customer_names_cache[key]
+            if names is not None and name not in names:
+                position = bisect.bisect(names, name)
+                _customer_names_cache[key] = names[:position] + (name,) + names[position:]
+
+
+# Address fields of every saved customer, keyed by customer name
+def get_customer_records():
+    try:
+        with engine.connect() as conn:
+            rows = conn.execute(select(
+                CustomerInfo.customer_name,
+                CustomerInfo.address_line1,
+                CustomerInfo.address_line2,
+                CustomerInfo.city,
+                CustomerInfo.state,
+                CustomerInfo.zip_code
+            )).all()
+        return {
+            row.customer_name: {
+                'address_line1': row.address_line1,
+                'address_line2': row.address_line2,
+                'city': row.city,
+                'state': row.state,
+                'zip_code': row.zip_code,
+            }
+            for row in rows
+        }
+    except SQLAlchemyError as e:
+        logger.error(f"Error fetching customer records from DB: {e}")
+        return {}
+
 
 # Customer Information Page
 def customer_info_layout():
-    session = Session()
-    try:
-        # Fetch all customer names from the CustomerInfo table
-        customer_names = [row[0] for row in session.query(CustomerInfo.customer_name).all()]
-        customer_options = [{'label': name, 'value': name} for name in customer_names]
-
-        return dbc.Container([
-            # Header Row
-            dbc.Row([
-                dbc.Col([
-                    html.H2("Customer Information", className="mb-4")
-                ], width=12)
-            ], className="mt-4"),
-
-            # Main content row
-            dbc.Row([
-                # Left Column - Customer Search
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardHeader("Search Customer"),
-                        dbc.CardBody([
-                            dbc.Label("Select Customer", className="mb-2"),
-                            dcc.Dropdown(
-                                id='customer-select',
-                                options=customer_options,
-                                placeholder="Select a customer",
-                                className="mb-3"
-                            ),
-                            html.Div(id='customer-info-display', className="mt-3")
-                        ])
-                    ], className="h-100")
-                ], width=6, className="mb-4"),
-
-                # Right Column - Add New Customer
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardHeader("Add New Customer"),
-                        dbc.CardBody([
-                            # Customer Name
-                            dbc.Row([
-                                dbc.Col([
-                                    dbc.Label("Customer Name", className="mb-2"),
-                                    dbc.Input(
-                                        id='new-customer-name',
-                                        placeholder="Enter customer name",
-                                        type="text",
-                                        size="lg",
-                                        className="mb-3"
-                                    ),
-                                ])
-                            ]),
-
-                            # Address Line 1
-                            dbc.Row([
-                                dbc.Col([
-                                    dbc.Label("Address Line 1", className="mb-2"),
-                                    dbc.Input(
-                                        id='new-address-line1',
-                                        placeholder="Street address",
-                                        type="text",
-                                        size="lg",
-                                        className="mb-3"
-                                    ),
-                                ])
-                            ]),
-
-                            # Address Line 2
-                            dbc.Row([
-                                dbc.Col([
-                                    dbc.Label("Address Line 2", className="mb-2"),
-                                    dbc.Input(
-                                        id='new-address-line2',
-                                        placeholder="Apt, Suite, Building (optional)",
-                                        type="text",
-                                        size="lg",
-                                        className="mb-3"
-                                    ),
-                                ])
-                            ]),
-
-                            # City, State, and Zip in one row
-                            dbc.Row([
-                                # City
-                                dbc.Col([
-                                    dbc.Label("City", className="mb-2"),
-                                    dbc.Input(
-                                        id='new-city',
-                                        placeholder="City",
-                                        type="text",
-                                        size="lg"
-                                    ),
-                                ], width=5),
-
-                                # State
-                                dbc.Col([
-                                    dbc.Label("State", className="mb-2"),
-                                    dbc.Input(
-                                        id='new-state',
-                                        placeholder="State",
-                                        type="text",
-                                        size="lg"
-                                    ),
-                                ], width=3),
-
-                                # Zip Code
-                                dbc.Col([
-                                    dbc.Label("Zip Code", className="mb-2"),
-                                    dbc.Input(
-                                        id='new-zip',
-                                        placeholder="Zip",
-                                        type="text",
-                                        size="lg"
-                                    ),
-                                ], width=4),
-                            ], className="mb-3"),
-
-                            # Submit Button
-                            dbc.Row([
-                                dbc.Col([
-                                    dbc.Button(
-                                        "Add New Customer",
-                                        id="add-customer-button",
-                                        color="primary",
-                                        size="lg",
-                                        className="mt-3 w-100"
-                                    ),
-                                ])
-                            ]),
-                        ])
+    # Fetch all customer names from the CustomerInfo table
+    customer_names = get_customer_names()
+
+    return dbc.Container([
+        # Saved customer addresses, so the details card renders clientside without a server round trip
+        dcc.Store(id='customer-info-store', data=get_customer_records()),
+
+        # Header Row
+        dbc.Row([
+            dbc.Col([
+                html.H2("Customer Information", className="mb-4")
+            ], width=12)
+        ], className="mt-4"),
+
+        # Main content row
+        dbc.Row([
+            # Left Column - Customer Search
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Search Customer"),
+                    dbc.CardBody([
+                        dbc.Label("Select Customer", className="mb-2"),
+                        dcc.Dropdown(
+                            id='customer-select',
+                            options=customer_names,
+                            placeholder="Select a customer",
+                            className="mb-3"
+                        ),
+                        html.Div(id='customer-info-display', className="mt-3")
                     ])
-                ], width=6, className="mb-4"),
-            ])
-        ], fluid=True)
-    finally:
-        session.close()
+                ], className="h-100")
+            ], width=6, className="mb-4"),
+
+            # Right Column - Add New Customer
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Add New Customer"),
+                    dbc.CardBody([
+                        # Customer Name
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Customer Name", className="mb-2"),
+                                dbc.Input(
+                                    id='new-customer-name',
+                                    placeholder="Enter customer name",
+                                    type="text",
+                                    size="lg",
+                                    className="mb-3"
+                                ),
+                            ])
+                        ]),
+
+                        # Address Line 1
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Address Line 1", className="mb-2"),
+                                dbc.Input(
+                                    id='new-address-line1',
+                                    placeholder="Street address",
+                                    type="text",
+                                    size="lg",
+                                    className="mb-3"
+                                ),
+                            ])
+                        ]),
+
+                        # Address Line 2
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Address Line 2", className="mb-2"),
+                                dbc.Input(
+                                    id='new-address-line2',
+                                    placeholder="Apt, Suite, Building (optional)",
+                                    type="text",
+                                    size="lg",
+                                    className="mb-3"
+                                ),
+                            ])
+                        ]),
+
+                        # City, State, and Zip in one row
+                        dbc.Row([
+                            # City
+                            dbc.Col([
+                                dbc.Label("City", className="mb-2"),
+                                dbc.Input(
+                                    id='new-city',
+                                    placeholder="City",
+                                    type="text",
+                                    size="lg"
+                                ),
+                            ], width=5),
+
+                            # State
+                            dbc.Col([
+                                dbc.Label("State", className="mb-2"),
+                                dbc.Input(
+                                    id='new-state',
+                                    placeholder="State",
+                                    type="text",
+                                    size="lg"
+                                ),
+                            ], width=3),
+
+                            # Zip Code
+                            dbc.Col([
+                                dbc.Label("Zip Code", className="mb-2"),
+                                dbc.Input(
+                                    id='new-zip',
+                                    placeholder="Zip",
+                                    type="text",
+                                    size="lg"
+                                ),
+                            ], width=4),
+                        ], className="mb-3"),
+
+                        # Submit Button
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Button(
+                                    "Add New Customer",
+                                    id="add-customer-button",
+                                    color="primary",
+                                    size="lg",
+                                    className="mt-3 w-100"
+                                ),
+                            ])
+                        ]),
+                    ])
+                ])
+            ], width=6, className="mb-4"),
+        ])
+    ], fluid=True)
+
+
+# Page layouts by path under /dashboard/; anything else shows the home page
+ROUTES = {
+    'orders': orders_layout,
+    'recent-purchases': recent_purchases_layout,
+    'stock-alerts': stock_alerts_layout,
+    'customer-information': customer_info_layout,
+}
 
 
 # Callback to render the appropriate page based on the URL
@@ -1315,16 +1767,7 @@ def display_page(pathname):
         relative_path = pathname
 
     # Route handling based on the relative path
-    if relative_path == 'orders':
-        return orders_layout()
-    elif relative_path == 'recent-purchases':
-        return recent_purchases_layout()
-    elif relative_path == 'stock-alerts':
-        return stock_alerts_layout()
-    elif relative_path == 'customer-information':
-        return customer_info_layout()
-    else:
-        return home_layout()
+    return ROUTES.get(relative_path, home_layout)()
 
 
 # **Combined Callback to Handle Both Inventory Updates and Filtering**
@@ -1332,30 +1775,63 @@ def display_page(pathname):
 
 
 
-# Callback to add new order items dynamically
+# Callback to add new order items dynamically; a Patch sends only the new row, not the whole list
 @dash_app.callback(
     Output('order-items', 'children'),
-    [Input('add-item-button', 'n_clicks')],
-    [State('order-items', 'children')]
+    [Input('add-item-button', 'n_clicks')]
 )
-def add_order_item(n_clicks, children):
-    if n_clicks > 0:
-        inventory = get_inventory_from_db()
-        casket_options = [{'label': item['product_name'], 'value': item['product_name']} for item in inventory]
-        new_item = create_order_item(n_clicks, casket_options)
-        children.append(new_item)
-        logger.debug(f"Added new order item with index {n_clicks}.")
+def add_order_item(n_clicks):
+    if not n_clicks:
+        return no_update
+    children = Patch()
+    children.append(create_order_item(n_clicks, get_casket_options()))
+    logger.debug(f"Added new order item with index {n_clicks}.")
     return children
 
 
-# Callback to handle order confirmation
+# Validate the order rows shared by confirm_order and display_order_summary.
+# Returns ([(casket_name, quantity), ...], None) or ([], alert) for the first invalid row.
+def _build_order_items(casket_list, quantity_list, purpose):
+    order_items = []
+    for idx, (casket_name, quantity) in enumerate(zip(casket_list, quantity_list)):
+        if casket_name and quantity:
+            if quantity <= 0:
+                logger.debug(f"Invalid quantity for item {idx + 1}: {quantity}")
+                return [], dbc.Alert(f"Please enter a valid quantity for item {idx + 1}.", color="danger")
+            order_items.append((casket_name, quantity))
+        elif casket_name or quantity:
+            logger.debug(f"Incomplete fields for item {idx + 1}.")
+            return [], dbc.Alert(
+                f"Please complete both casket and quantity fields for item {idx + 1}, or leave both empty.",
+                color="danger")
+
+    if not order_items:
+        logger.debug("No order items added.")
+        return [], dbc.Alert(f"Please select at least one casket and quantity to {purpose}.", color="danger")
+    return order_items, None
+
+
+# Callback for both order buttons; only the clicked button's output is updated
 @dash_app.callback(
-    Output('order-confirmation', 'children'),
-    [Input('confirm-order-button', 'n_clicks')],
+    [Output('order-confirmation', 'children'),
+     Output('order-summary', 'children')],
+    [Input('confirm-order-button', 'n_clicks'),
+     Input('generate-order-button', 'n_clicks')],
     [State('customer-dropdown', 'value'),
      State({'type': 'casket-dropdown', 'index': ALL}, 'value'),
      State({'type': 'quantity-input', 'index': ALL}, 'value')]
 )
+def handle_order_buttons(confirm_clicks, summary_clicks, customer, casket_list, quantity_list):
+    triggered_ids = {t['prop_id'].split('.')[0] for t in callback_context.triggered}
+    if 'confirm-order-button' in triggered_ids:
+        return confirm_order(confirm_clicks, customer, casket_list, quantity_list), no_update
+    if 'generate-order-button' in triggered_ids:
+        return no_update, display_order_summary(summary_clicks, customer, casket_list, quantity_list)
+    return "", ""
+
+
+# Confirm an order: check stock, decrement inventory and record the purchases
+@query_budget(3)
 def confirm_order(n_clicks, customer, casket_list, quantity_list):
     if n_clicks > 0:
         if not customer:
@@ -1363,63 +1839,62 @@ def confirm_order(n_clicks, customer, casket_list, quantity_list):
             return dbc.Alert("Please select a customer.", color="danger")
 
         # Prepare list of items to process
-        order_items = []
-        for idx, (casket_name, quantity) in enumerate(zip(casket_list, quantity_list)):
-            if casket_name and quantity:
-                if quantity <= 0:
-                    logger.debug(f"Invalid quantity for item {idx + 1}: {quantity}")
-                    return dbc.Alert(f"Please enter a valid quantity for item {idx + 1}.", color="danger")
-                order_items.append({'casket': casket_name, 'quantity': quantity})
-            elif casket_name or quantity:
-                logger.debug(f"Incomplete fields for item {idx + 1}.")
-                return dbc.Alert(
-                    f"Please complete both casket and quantity fields for item {idx + 1}, or leave both empty.",
-                    color="danger")
-
-        if not order_items:
-            logger.debug("No order items added.")
-            return dbc.Alert("Please select at least one casket and quantity to place an order.", color="danger")
+        order_items, error = _build_order_items(casket_list, quantity_list, "place an order")
+        if error:
+            return error
 
         # Process the order
         session = Session()
         try:
-            for item in order_items:
-                casket_name = item['casket']
-                quantity = item['quantity']
-                # Fetch the inventory item
-                inventory_item = session.query(Inventory).filter_by(product_name=casket_name).first()
-                if inventory_item:
-                    if inventory_item.quantity >= quantity:
-                        # Subtract the quantity
-                        inventory_item.quantity -= quantity
-
-                        # Add the purchase to the 'purchase' table
-                        purchase = Purchase(
-                            customer=customer,
-                            product_name=casket_name,
-                            quantity=quantity,
-                            date_purchased=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        )
-                        session.add(purchase)
-                    else:
-                        logger.debug(f"Insufficient stock for {casket_name}. Available: {inventory_item.quantity}")
-                        return dbc.Alert(f"Insufficient stock for {casket_name}. Available: {inventory_item.quantity}",
-                                         color="danger")
-                else:
+            # Take the write lock before reading stock so concurrent orders can't both pass the check
+            # (SQLite has no SELECT ... FOR UPDATE; BEGIN IMMEDIATE serves the same purpose)
+            session.connection(execution_options={'sqlite_immediate': True})
+
+            # Load every casket in the order with one query
+            casket_names = {casket_name for casket_name, _ in order_items}
+            inventory_items = {
+                item.product_name: item
+                for item in session.query(Inventory).filter(Inventory.product_name.in_(casket_names)).all()
+            }
+
+            # All lines of one order share the same purchase timestamp
+            date_purchased = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            purchases = []
+            for casket_name, quantity in order_items:
+                inventory_item = inventory_items.get(casket_name)
+                if not inventory_item:
+                    session.rollback()
                     logger.debug(f"Casket {casket_name} not found in inventory.")
                     return dbc.Alert(f"Casket {casket_name} not found in inventory.", color="danger")
-
+                if inventory_item.quantity < quantity:
+                    # Read the remaining quantity before rollback expires the instance (and undoes
+                    # this order's earlier decrements of the same casket)
+                    available = inventory_item.quantity
+                    session.rollback()
+                    logger.debug(f"Insufficient stock for {casket_name}. Available: {available}")
+                    return dbc.Alert(f"Insufficient stock for {casket_name}. Available: {available}",
+                                     color="danger")
+
+                # Subtract the quantity from inventory
+                inventory_item.quantity -= quantity
+
+                # Add the purchase to the 'purchase' table
+                purchases.append(Purchase(
+                    customer=customer,
+                    product_name=casket_name,
+                    quantity=quantity,
+                    date_purchased=date_purchased
+                ))
+
+            session.bulk_save_objects(purchases)
             session.commit()
-            # Publish updates to MQTT
-            for item in order_items:
-                casket_name = item['casket']
-                quantity = item['quantity']
-                inventory_item = session.query(Inventory).filter_by(product_name=casket_name).first()
-                if inventory_item:
-                    publish_to_mqtt('update', {
-                        'product_name': casket_name,
-                        'quantity': inventory_item.quantity
-                    })
+            clear_recent_purchases_layout_cache()
+            # Publish the new quantities to MQTT straight from the loaded rows
+            updates = [
+                {'product_name': casket_name, 'quantity': inventory_items[casket_name].quantity}
+                for casket_name in casket_names
+            ]
+            publish_to_mqtt('bulk_update', updates)
             logger.debug("Order confirmed successfully.")
             return dbc.Alert("Order confirmed successfully!", color="success")
         except Exception as e:
@@ -1431,43 +1906,30 @@ def confirm_order(n_clicks, customer, casket_list, quantity_list):
     return ""
 
 
-# Callback to generate order summary
-@dash_app.callback(
-    Output('order-summary', 'children'),
-    [Input('generate-order-button', 'n_clicks')],
-    [State('customer-dropdown', 'value'),
-     State({'type': 'casket-dropdown', 'index': ALL}, 'value'),
-     State({'type': 'quantity-input', 'index': ALL}, 'value')]
-)
+# Generate the printable order summary
+@query_budget(1)
 def display_order_summary(n_clicks, customer, casket_list, quantity_list):
     if n_clicks > 0:
+        # Prepare list of items; validation needs no database access, so it runs first
+        order_items, error = _build_order_items(casket_list, quantity_list, "generate an order summary")
+        if error:
+            return error
+
         session = Session()
         try:
             # Convert to uppercase only for database lookup
             customer_name = customer.upper() if customer else customer
-            customer_info = session.query(CustomerInfo).filter_by(customer_name=customer_name).first()
+            # Only the address columns are needed, so select them rather than the whole ORM row
+            customer_info = session.query(
+                CustomerInfo.address_line1,
+                CustomerInfo.address_line2,
+                CustomerInfo.city,
+                CustomerInfo.state,
+                CustomerInfo.zip_code
+            ).filter_by(customer_name=customer_name).first()
             if not customer_info:
                 return dbc.Alert("Customer information not found.", color="danger")
 
-            # Prepare list of items
-            order_items = []
-            for idx, (casket_name, quantity) in enumerate(zip(casket_list, quantity_list)):
-                if casket_name and quantity:
-                    if quantity <= 0:
-                        logger.debug(f"Invalid quantity for item {idx + 1}: {quantity}")
-                        return dbc.Alert(f"Please enter a valid quantity for item {idx + 1}.", color="danger")
-                    order_items.append({'casket': casket_name, 'quantity': quantity})
-                elif casket_name or quantity:
-                    logger.debug(f"Incomplete fields for item {idx + 1}.")
-                    return dbc.Alert(
-                        f"Please complete both casket and quantity fields for item {idx + 1}, or leave both empty.",
-                        color="danger")
-
-            if not order_items:
-                logger.debug("No order items added.")
-                return dbc.Alert("Please select at least one casket and quantity to generate an order summary.",
-                                 color="danger")
-
             # Create print layout
             print_layout = html.Div([
                 # Add margin-top to account for letterhead
@@ -1498,9 +1960,9 @@ def display_order_summary(n_clicks, customer, casket_list, quantity_list):
                                     style={'borderBottom': '1px solid black', 'width': '20%', 'textAlign': 'center'}),
                         ]),
                         *[html.Tr([
-                            html.Td(item['casket']),
-                            html.Td(str(item['quantity']), style={'textAlign': 'center'})
-                        ]) for item in order_items]
+                            html.Td(casket_name),
+                            html.Td(str(quantity), style={'textAlign': 'center'})
+                        ]) for casket_name, quantity in order_items]
                     ], style={'width': '100%', 'marginBottom': '50px'}),
                 ]),
 
@@ -1600,96 +2062,134 @@ dash_app.clientside_callback(
 )
 
 
-# Callback to update the recent purchases table based on the filters
+# Recent purchases filter predicates; customer/product lists are bound as JSON arrays
+RECENT_PURCHASES_DATE_FILTER = "date_purchased >= date('now', '-30 days')"
+RECENT_PURCHASES_CUSTOMER_FILTER = "customer IN (SELECT value FROM json_each(:customers))"
+RECENT_PURCHASES_PRODUCT_FILTER = "product_name IN (SELECT value FROM json_each(:products))"
+RECENT_PURCHASES_COUNT_QUERY = "SELECT COUNT(*) AS total FROM purchase WHERE {where}"
+RECENT_PURCHASES_PAGE_QUERY = (
+    "SELECT customer, product_name, quantity, date_purchased FROM purchase"
+    " WHERE {where} ORDER BY {order} LIMIT :limit OFFSET :offset"
+)
+# Columns the table may be sorted by; anything else falls back to newest first
+RECENT_PURCHASES_SORT_COLUMNS = frozenset({'customer', 'product_name', 'quantity', 'date_purchased'})
+RECENT_PURCHASES_PAGE_SIZE = 25
+
+
+# WHERE clause with only the active filters, so SQLite can use ix_purchase_cust_date /
+# ix_purchase_prod_date; "IS NULL OR" predicates would hide them from the planner
+def _recent_purchases_where(by_customer, by_product):
+    predicates = [RECENT_PURCHASES_DATE_FILTER]
+    if by_customer:
+        predicates.append(RECENT_PURCHASES_CUSTOMER_FILTER)
+    if by_product:
+        predicates.append(RECENT_PURCHASES_PRODUCT_FILTER)
+    return " AND ".join(predicates)
+
+
+# Callback to update the recent purchases table based on the filters, one page at a time
 @dash_app.callback(
-    Output('recent-purchases-table', 'data'),
+    [Output('recent-purchases-table', 'data'),
+     Output('recent-purchases-table', 'page_count'),
+     Output('recent-purchases-table', 'page_current')],
     [Input('customer-filter', 'value'),
-     Input('product-filter', 'value')]
+     Input('product-filter', 'value'),
+     Input('recent-purchases-table', 'page_current'),
+     Input('recent-purchases-table', 'page_size'),
+     Input('recent-purchases-table', 'sort_by')]
 )
-def update_recent_purchases_table(customer_filter, product_filter):
+@query_budget(2)
+def update_recent_purchases_table(customer_filter, product_filter, page_current, page_size, sort_by):
     logger.debug(f"Filtering recent purchases with customer: {customer_filter}, product: {product_filter}")
-    try:
-        query = """
-            SELECT customer, product_name, quantity, date_purchased
-            FROM purchase
-            WHERE date_purchased >= date('now', '-30 days')
-        """
-        params = []
+    triggered_ids = {t['prop_id'].split('.')[0] for t in callback_context.triggered}
+    # Only a filter change (or the first render) alters the row count; paging and sorting reuse it
+    filters_changed = not callback_context.triggered or bool(triggered_ids & {'customer-filter', 'product-filter'})
+    if filters_changed:
+        page_current = 0
+    page_current = page_current or 0
+    page_size = page_size or RECENT_PURCHASES_PAGE_SIZE
+
+    order = "date_purchased DESC"
+    if sort_by and sort_by[0]['column_id'] in RECENT_PURCHASES_SORT_COLUMNS:
+        direction = "ASC" if sort_by[0]['direction'] == 'asc' else "DESC"
+        order = f"{sort_by[0]['column_id']} {direction}, date_purchased DESC"
 
+    try:
+        # Filter lists are bound as JSON arrays, so the SQL text depends only on which filters are set
+        where = _recent_purchases_where(bool(customer_filter), bool(product_filter))
+        params = {}
         if customer_filter:
-            placeholders = ','.join('?' for _ in customer_filter)
-            query += f" AND customer IN ({placeholders})"
-            params.extend(customer_filter)
+            params['customers'] = json.dumps(customer_filter)
         if product_filter:
-            placeholders = ','.join('?' for _ in product_filter)
-            query += f" AND product_name IN ({placeholders})"
-            params.extend(product_filter)
-
-        query += " ORDER BY date_purchased DESC"
-
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-        data = [{"customer": row[0], "product_name": row[1], "quantity": row[2], "date_purchased": row[3]} for row in
-                rows]
+            params['products'] = json.dumps(product_filter)
+
+        # Pooled engine connection, so the database file and its page cache stay open between calls
+        page_count = no_update
+        with engine.connect() as conn:
+            if filters_changed:
+                total = conn.execute(text(RECENT_PURCHASES_COUNT_QUERY.format(where=where)), params).scalar()
+                page_count = max(1, -(-total // page_size))
+            result = conn.execute(text(RECENT_PURCHASES_PAGE_QUERY.format(where=where, order=order)),
+                                  {**params, 'limit': page_size, 'offset': page_current * page_size})
+            data = [dict(row) for row in result.mappings()]
         logger.debug(f"Filtered recent purchases data: {data}")
-        return data
+        return data, page_count, page_current
     except Exception as e:
         logger.error(f"Error filtering recent purchases: {e}")
-        return []
+        return [], no_update, no_update
 
 
-# Callback for Customer Information
-@dash_app.callback(
+# Client-side callback for Customer Information: renders the details card from 'customer-info-store'
+dash_app.clientside_callback(
+    """
+    function(selectedCustomer, customers) {
+        if (!selectedCustomer) {
+            return [];
+        }
+        var info = (customers || {})[selectedCustomer];
+        if (!info) {
+            return {namespace: 'dash_bootstrap_components', type: 'Alert',
+                    props: {children: 'No customer information found.', color: 'warning'}};
+        }
+
+        function dbc(type, props) {
+            return {namespace: 'dash_bootstrap_components', type: type, props: props};
+        }
+        function html(type, props) {
+            return {namespace: 'dash_html_components', type: type, props: props};
+        }
+        function row(children, className) {
+            return dbc('Row', {children: [dbc('Col', {children: children, className: className})]});
+        }
+
+        var rows = [
+            html('H5', {children: 'Customer Details', className: 'mb-3'}),
+            row([html('Strong', {children: 'Name: ', className: 'mr-2'}),
+                 html('Span', {children: selectedCustomer})], 'mb-2'),
+            row([html('Strong', {children: 'Address: ', className: 'mr-2'}),
+                 html('Span', {children: info.address_line1})], 'mb-2'),
+        ];
+        if (info.address_line2) {
+            rows.push(row([html('Span', {children: info.address_line2})], 'mb-2'));
+        }
+        rows.push(row([html('Span', {children: info.city + ', ' + info.state + ' ' + info.zip_code})]));
+        return dbc('Card', {children: [dbc('CardBody', {children: rows})], className: 'mt-3'});
+    }
+    """,
     Output('customer-info-display', 'children'),
-    [Input('customer-select', 'value')]
+    [Input('customer-select', 'value')],
+    [State('customer-info-store', 'data')]
 )
-def display_customer_info(selected_customer):
-    session = Session()
-    try:
-        if selected_customer:
-            customer_info = session.query(CustomerInfo).filter_by(customer_name=selected_customer).first()
-            if customer_info:
-                return dbc.Card([
-                    dbc.CardBody([
-                        html.H5("Customer Details", className="mb-3"),
-                        dbc.Row([
-                            dbc.Col([
-                                html.Strong("Name: ", className="mr-2"),
-                                html.Span(customer_info.customer_name),
-                            ], className="mb-2"),
-                        ]),
-                        dbc.Row([
-                            dbc.Col([
-                                html.Strong("Address: ", className="mr-2"),
-                                html.Span(customer_info.address_line1),
-                            ], className="mb-2"),
-                        ]),
-                        dbc.Row([
-                            dbc.Col([
-                                html.Span(customer_info.address_line2 or ""),
-                            ], className="mb-2") if customer_info.address_line2 else None,
-                        ]),
-                        dbc.Row([
-                            dbc.Col([
-                                html.Span(f"{customer_info.city}, {customer_info.state} {customer_info.zip_code}"),
-                            ]),
-                        ]),
-                    ])
-                ], className="mt-3")
-            else:
-                return dbc.Alert("No customer information found.", color="warning")
-        else:
-            return []
-    finally:
-        session.close()
+
+
+# Shared "change nothing" result for add_new_customer's early and error returns
+_NO_CUSTOMER_UPDATE = (no_update, no_update, no_update)
 
 
 @dash_app.callback(
     Output('customer-select', 'options'),
     Output('customer-select', 'value'),
+    Output('customer-info-store', 'data'),
     [Input("add-customer-button", "n_clicks")],
     [State("new-customer-name", "value"),
      State("new-address-line1", "value"),
@@ -1700,27 +2200,29 @@ def display_customer_info(selected_customer):
 def add_new_customer(n_clicks, name, address_line1, address_line2, city, state, zip_code):
     # Check if this is the initial call
     if n_clicks is None:
-        session = Session()
-        try:
-            # Get initial customer options
-            customer_names = [row[0] for row in session.query(CustomerInfo.customer_name).all()]
-            customer_options = [{'label': name, 'value': name} for name in customer_names]
-            return customer_options, None
-        finally:
-            session.close()
+        # Get initial customer options; the store was filled by the layout
+        return get_customer_names(), None, no_update
 
     # Check if we have the required fields
     if not name or not address_line1 or not city or not state or not zip_code:
         logger.warning("Missing required customer information fields")
-        return dash.no_update, dash.no_update
+        return _NO_CUSTOMER_UPDATE
+
+    # Normalize once; every saved name is uppercase, so lookups match the stored key exactly
+    name = name.upper()
 
     session = Session()
     try:
-        # Convert name to uppercase before processing
-        name = name.upper() if name else name
 
         # Check if the customer already exists
         existing_customer = session.query(CustomerInfo).filter_by(customer_name=name).first()
+        record = {
+            'address_line1': address_line1,
+            'address_line2': address_line2,
+            'city': city,
+            'state': state,
+            'zip_code': zip_code,
+        }
         if existing_customer:
             # Update the existing customer's address
             existing_customer.address_line1 = address_line1
@@ -1743,41 +2245,68 @@ def add_new_customer(n_clicks, name, address_line1, address_line2, city, state,
             logger.info(f"Added new customer: {name}")
 
         session.commit()
+        # Update the cached names and the store in place rather than re-reading them
+        if not existing_customer:
+            add_to_customer_names_cache(name)
+        records = Patch()
+        records[name] = record
 
-        # Refresh the customer options
-        customer_names = [row[0] for row in session.query(CustomerInfo.customer_name).all()]
-        customer_options = [{'label': name, 'value': name} for name in customer_names]
-        return customer_options, name
+        # Refresh the customer options and the addresses behind the details card
+        return get_customer_names(), name, records
 
     except Exception as e:
         session.rollback()
+        clear_customer_names_cache()
         logger.error(f"Error adding/updating customer: {e}")
-        return dash.no_update, dash.no_update
+        return _NO_CUSTOMER_UPDATE
     finally:
         session.close()
 
 
-# Callback to handle stock alerts table updates (if needed)
+# Shared result for a failed stock alerts refresh; the empty list is never mutated
+_EMPTY_STOCK_ALERTS = ([], no_update)
+
+
+# Callback to refresh the stock alerts table when inventory changes
 @dash_app.callback(
-    Output('stock-alerts-table', 'data'),
-    [Input('stock-alerts-table', 'data_timestamp')]
+    [Output('stock-alerts-table', 'data'),
+     Output('stock-alerts-version', 'data')],
+    [Input('stock-alerts-interval', 'n_intervals')],
+    [State('stock-alerts-version', 'data')]
 )
-def update_stock_alerts(data_timestamp):
+def update_stock_alerts(n_intervals, version):
+    # Inventory unchanged (here or by the scanner apps) since the table was filled, so skip the query
+    current_version = get_inventory_version()
+    if version == current_version:
+        return no_update, no_update
+
     logger.debug("Updating stock alerts table.")
     try:
-        stock_alerts = get_stock_alerts_from_db()
-        data = [{"product_name": item['product_name'], "quantity": item['quantity']} for item in stock_alerts]
+        # Rows are already {product_name, quantity} dicts straight from the SQL projection
+        data = get_cached_stock_alerts()
         logger.debug(f"Updated stock alerts data: {data}")
-        return data
+        return data, current_version
     except Exception as e:
         logger.error(f"Error updating stock alerts table: {e}")
-        return []
+        return _EMPTY_STOCK_ALERTS
+
 
+# Worker threads for the WSGI server; matches the engine's pool_size
+WSGI_THREADS = 16
 
 # Run the Flask and Dash app together
 if __name__ == '__main__':
     logger.debug("Starting Flask and Dash app with MQTT support")
+    # waitress is optional; without it, fall back to Flask's threaded development server
     try:
-        dash_app.run_server(host='0.0.0.0', port=5000, debug=True)
+        from waitress import serve
+    except ImportError:
+        serve = None
+    try:
+        if serve:
+            serve(app, host='0.0.0.0', port=5000, threads=WSGI_THREADS)
+        else:
+            logger.warning("waitress is not installed; using the Flask development server")
+            app.run(host='0.0.0.0', port=5000, threaded=True)
     except Exception as e:
         logger.error(f"Error starting app: {e}")
\ No newline at end of file
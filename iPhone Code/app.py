@@ -3,16 +3,32 @@ from flask import Flask, request, jsonify, render_template, make_response
 from flask_cors import CORS
 import logging
 import sys
+import queue
+import threading
+import time
 import re  # Import regular expressions module
 import json  # For handling JSON with MQTT
-from sqlalchemy import create_engine, Column, String, Integer
-from sqlalchemy.orm import declarative_base, sessionmaker, scoped_session
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from sqlalchemy import create_engine, Column, String, Integer, event, select
+from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import RequestEntityTooLarge
 import paho.mqtt.client as mqtt  # Importing MQTT library
 
+# orjson is optional; it serializes straight to bytes and is much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
 CORS(app)
 
+# Reject oversized request bodies (413) before they are parsed; a full batch is well under this
+app.config['MAX_CONTENT_LENGTH'] = 256 * 1024
+
 # Set up logging
 logging.basicConfig(level=logging.DEBUG)
 app.logger.addHandler(logging.StreamHandler(sys.stdout))
@@ -25,8 +41,35 @@ os.makedirs(instance_path, exist_ok=True)
 # Database file path
 db_path = os.path.join(instance_path, 'inventory.db')
 
-# Create the engine and base
-engine = create_engine('sqlite:///' + db_path)
+# Create the engine and base; pooled connections are reused across /scan requests
+engine = create_engine(
+    'sqlite:///' + db_path,
+    connect_args={'check_same_thread': False, 'timeout': 30},
+    pool_size=16,  # one connection per WSGI server thread (see WSGI_THREADS)
+    max_overflow=8,
+    pool_recycle=3600
+)
+
+# Set up SQLite PRAGMAs once per pooled connection, not per request
+@event.listens_for(engine, "connect")
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging so readers don't block the writer
+    cursor.execute("PRAGMA synchronous = NORMAL")  # Safe with WAL, fewer fsyncs per commit
+    cursor.execute("PRAGMA temp_store = MEMORY")
+    cursor.execute("PRAGMA cache_size = -64000")  # ~64 MB page cache
+    cursor.close()
+    # Let SQLAlchemy emit BEGIN itself (see do_begin) instead of pysqlite's implicit transactions
+    dbapi_connection.isolation_level = None
+
+# Start transactions explicitly; sessions can request IMMEDIATE to take the write lock up front
+@event.listens_for(engine, "begin")
+def do_begin(conn):
+    if conn.get_execution_options().get('sqlite_immediate'):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+    else:
+        conn.exec_driver_sql("BEGIN")
+
 Base = declarative_base()
 
 # Define the Inventory model
@@ -40,48 +83,102 @@ class Inventory(Base):
     color = Column(String)
     quantity = Column(Integer, default=1)
 
-# Create tables (if not exists)
-Base.metadata.create_all(engine)
+# Create tables (if not exists) on the first request rather than at import, so reloader and
+# worker imports don't each pay for the schema checks
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+def _init_schema():
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if not _schema_ready:
+            Base.metadata.create_all(engine)
+            _schema_ready = True
 
-# Create a scoped session
-SessionFactory = sessionmaker(bind=engine)
-Session = scoped_session(SessionFactory)
+# Session factory; each request opens its own session in a with block, so every request starts
+# with a clean identity map
+Session = sessionmaker(bind=engine, expire_on_commit=False)
 
 # Define MQTT client
 broker_url = "test.mosquitto.org"  # Use Mosquitto's public broker for now
 mqtt_client = mqtt.Client()
 
-# Connect to the MQTT broker with error handling
-try:
-    mqtt_client.connect(broker_url, 1883)  # Default port for MQTT
-except Exception as e:
-    app.logger.error(f"Failed to connect to MQTT broker: {e}")
+# QoS 0 is fire-and-forget (the database stays the source of truth); set MQTT_QOS=1 to require broker acks
+MQTT_QOS = int(os.environ.get('MQTT_QOS', '0'))
+if MQTT_QOS > 0:
+    mqtt_client.max_inflight_messages_set(100)
+
+# Connected lazily by the publisher thread, so importing the app never waits on the broker
+MQTT_MAX_BACKOFF = 60  # seconds
+_mqtt_connected = False
+
+# Connect to the MQTT broker, retrying with exponential backoff; only the publisher thread calls this
+def _ensure_mqtt():
+    global _mqtt_connected
+    delay = 1
+    while not _mqtt_connected:
+        try:
+            mqtt_client.connect(broker_url, 1883)  # Default port for MQTT
+            mqtt_client.loop_start()  # Network loop runs on paho's own thread and handles reconnects
+            _mqtt_connected = True
+        except Exception as e:
+            app.logger.error(f"Failed to connect to MQTT broker: {e}; retrying in {delay}s")
+            time.sleep(delay)
+            delay = min(delay * 2, MQTT_MAX_BACKOFF)
+
+# Outgoing messages, drained by the publisher thread so /scan never waits on the broker
+MQTT_QUEUE_SIZE = 1000
+_mqtt_queue = queue.Queue(maxsize=MQTT_QUEUE_SIZE)
+
+# Fixed parts of the {"action": ..., "data": ...} message; only the data is serialized per message
+_MSG_PREFIX = b'{"action":"'
+_MSG_MID = b'","data":'
+_MSG_SUFFIX = b'}'
+
+# Serialize message data to JSON bytes
+def _dumps(data):
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+# Build the MQTT payload; action is always one of this module's own plain-ASCII literals
+def _encode_message(action, data):
+    return _MSG_PREFIX + action.encode('ascii') + _MSG_MID + _dumps(data) + _MSG_SUFFIX
 
 # Function to publish messages to MQTT
 def publish_to_mqtt(action, data):
-    message = {
-        "action": action,
-        "data": data
-    }
-    result = mqtt_client.publish("inventory/updates", json.dumps(message), qos=1)  # QoS 1 for delivery guarantee
-    if result.rc != mqtt.MQTT_ERR_SUCCESS:
-        app.logger.error(f"Failed to publish MQTT message: {result.rc}")
+    try:
+        _mqtt_queue.put_nowait((action, data))
+    except queue.Full:
+        app.logger.error(f"MQTT queue full, dropping message: {action} {data}")
+
+# Background thread that sends queued messages to the broker
+def _publisher():
+    while True:
+        action, data = _mqtt_queue.get()
+        _ensure_mqtt()
+        try:
+            payload = _encode_message(action, data)
+            result = mqtt_client.publish("inventory/updates", payload, qos=MQTT_QOS)
+            if result.rc != mqtt.MQTT_ERR_SUCCESS:
+                app.logger.error(f"Failed to publish MQTT message: {result.rc}")
+        except Exception as e:
+            app.logger.error(f"Error publishing MQTT message: {e}")
+
+threading.Thread(target=_publisher, name='mqtt-publisher', daemon=True).start()
+
+# Barcode type by length; any other length is treated as CODE-128
+_BARCODE_TYPE_BY_LEN = {8: "EAN-8", 12: "UPC-A", 13: "EAN-13", 14: "GTIN-14"}
 
 # Define a function to determine barcode type
 def determine_barcode_type(barcode):
     # Simple determination based on length
-    if len(barcode) == 8:
-        return "EAN-8"
-    elif len(barcode) == 13:
-        return "EAN-13"
-    elif len(barcode) == 12:
-        return "UPC-A"
-    elif len(barcode) == 14:
-        return "GTIN-14"
-    else:
-        return "CODE-128"
+    return _BARCODE_TYPE_BY_LEN.get(len(barcode), "CODE-128")
 
-# Extract make/model from barcode
+# Extract make/model from barcode; the same barcodes repeat throughout a scanning session
+@lru_cache(maxsize=4096)
 def extract_make_model(barcode):
     # Check if the barcode contains a hyphen (e.g., '110650-2311164')
     if '-' in barcode:
@@ -97,33 +194,50 @@ barcode_name_mapping = {
     # Add other mappings as needed
 }
 
+# Distinct key lengths in the mapping, longest first, for longest-prefix matching
+_MAPPING_PREFIX_LENGTHS = sorted({len(key) for key in barcode_name_mapping}, reverse=True)
+
+# Resolve a code to a product name by its longest mapped prefix (e.g. a GS1 company prefix)
+@lru_cache(maxsize=4096)
+def resolve_barcode_name(code):
+    for length in _MAPPING_PREFIX_LENGTHS:
+        name = barcode_name_mapping.get(code[:length])
+        if name is not None:
+            return name
+    return 'Unknown'
+
 # Function to add or update inventory
 def add_or_update_inventory(session, scanned_barcode, name=None, make=None, model=None, color=None):
-    # Check if the barcode is already in the inventory
-    item = session.query(Inventory).filter_by(barcode=scanned_barcode).first()
-    
-    if item:
-        # If it exists, increment the quantity
-        item.quantity += 1
-        app.logger.debug(f"Updated inventory for {scanned_barcode}. New quantity: {item.quantity}")
-        action = 'updated'
-    else:
-        # If it doesn't exist, add it with the initial quantity of 1
-        new_item = Inventory(
-            barcode=scanned_barcode,
-            name=name,       # Include the name
-            make=make,
-            model=model,
-            color=color,
-            quantity=1
-        )
-        session.add(new_item)
-        app.logger.debug(f"Added new item to inventory: {scanned_barcode}")
-        action = 'added'
-    
+    table = Inventory.__table__
+    # Take the write lock before checking for the row, so no other writer can insert it in between
+    session.connection(execution_options={'sqlite_immediate': True})
+    existed = session.execute(select(table.c.id).where(table.c.barcode == scanned_barcode)).first() is not None
+
+    # Insert the barcode with quantity 1, or increment it if it already exists, in one UPSERT statement
+    stmt = insert(Inventory).values(
+        barcode=scanned_barcode,
+        name=name,       # Include the name
+        make=make,
+        model=model,
+        color=color,
+        quantity=1
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['barcode'],
+        set_={'quantity': table.c.quantity + 1}
+    ).returning(table.c.quantity)
+    quantity = session.execute(stmt).scalar_one()
+
     # Commit the changes to the database
     session.commit()
-    
+
+    if not existed:
+        app.logger.debug(f"Added new item to inventory: {scanned_barcode}")
+        action = 'added'
+    else:
+        app.logger.debug(f"Updated inventory for {scanned_barcode}. New quantity: {quantity}")
+        action = 'updated'
+
     # Publish update to MQTT
     publish_to_mqtt(action, {
         "barcode": scanned_barcode,
@@ -131,11 +245,89 @@ def add_or_update_inventory(session, scanned_barcode, name=None, make=None, mode
         "make": make,
         "model": model,
         "color": color,
-        "quantity": item.quantity if item else 1
+        "quantity": quantity
     })
-    
+
     return action
 
+# Most barcodes accepted in one batch /scan request
+MAX_SCAN_BATCH = 500
+
+# Rows per multi-row UPSERT; at 6 bound parameters a row this stays under SQLite's default
+# limit of 999 variables per statement
+UPSERT_CHUNK_ROWS = 150
+
+# Function to add or update many scanned barcodes at once; counts maps make_model_code -> times scanned
+def add_or_update_inventory_batch(session, counts, name_for):
+    table = Inventory.__table__
+    rows = [
+        {
+            "barcode": barcode,
+            "name": name_for(barcode),
+            "make": 'Unknown',
+            "model": 'Unknown',
+            "color": 'Unknown',
+            "quantity": count
+        }
+        for barcode, count in counts.items()
+    ]
+    # Take the write lock, then note which barcodes already exist; MAX_SCAN_BATCH keeps this IN list
+    # under SQLite's variable limit
+    session.connection(execution_options={'sqlite_immediate': True})
+    existing = set(session.execute(select(table.c.barcode).where(table.c.barcode.in_(counts))).scalars())
+
+    # Multi-row UPSERTs: new barcodes start at their scan count, existing ones are incremented by it
+    quantities = {}
+    for start in range(0, len(rows), UPSERT_CHUNK_ROWS):
+        stmt = insert(Inventory).values(rows[start:start + UPSERT_CHUNK_ROWS])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['barcode'],
+            set_={'quantity': table.c.quantity + stmt.excluded.quantity}
+        ).returning(table.c.barcode, table.c.quantity)
+        quantities.update(session.execute(stmt).all())
+
+    # Commit the whole batch in one transaction
+    session.commit()
+
+    items = [
+        {
+            "barcode": barcode,
+            "name": name_for(barcode),
+            "quantity": quantities[barcode],
+            "action": 'updated' if barcode in existing else 'added'
+        }
+        for barcode in counts
+    ]
+    app.logger.debug(f"Processed batch of {len(items)} barcodes: {items}")
+
+    # Publish the whole batch as one MQTT message
+    publish_to_mqtt('batch', items)
+
+    return items
+
+# Repeat scans of the same barcode from the same client within this window (scanner autorepeat)
+# get the first scan's response back without touching the database
+SCAN_DEBOUNCE_SECONDS = float(os.environ.get('SCAN_DEBOUNCE_SECONDS', '0.25'))
+SCAN_DEBOUNCE_MAX_ENTRIES = 4096
+_recent_scans = OrderedDict()  # (barcode, client) -> (expires, response body)
+_recent_scans_lock = threading.Lock()
+
+# Return the response of a matching scan still inside the debounce window, if any
+def get_recent_scan(key):
+    with _recent_scans_lock:
+        entry = _recent_scans.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+    return None
+
+# Remember a scan's response for the debounce window, evicting the oldest entries past the cap
+def remember_scan(key, body):
+    with _recent_scans_lock:
+        _recent_scans[key] = (time.monotonic() + SCAN_DEBOUNCE_SECONDS, body)
+        _recent_scans.move_to_end(key)
+        while len(_recent_scans) > SCAN_DEBOUNCE_MAX_ENTRIES:
+            _recent_scans.popitem(last=False)
+
 @app.route('/')
 def home():
     app.logger.debug("Home route accessed")
@@ -145,62 +337,111 @@ def home():
 
 @app.route('/scan', methods=['POST'])
 def scan():
-    session = Session()
-    try:
-        app.logger.info('Received request at /scan')
-        data = request.get_json()
-        app.logger.debug(f"Request data: {data}")
-
-        barcode_data = data.get('barcode')
-        app.logger.debug(f"Barcode data: {barcode_data}")
-
-        if not barcode_data or not isinstance(barcode_data, str):
-            app.logger.warning('Invalid barcode data provided in the request.')
-            return jsonify({"error": "Invalid barcode provided."}), 400
-
-        # Extract the make/model code from the barcode
-        make_model_code = extract_make_model(barcode_data)
-        if not make_model_code:
-            return jsonify({"error": "Invalid barcode format."}), 400
-        app.logger.debug(f"Extracted make/model code: {make_model_code}")
-
-        # Determine the barcode type
-        barcode_type = determine_barcode_type(barcode_data)
-
-        # Get the name associated with the barcode
-        name = barcode_name_mapping.get(make_model_code, 'Unknown')  # Use mapping or default to 'Unknown'
-
-        # Optionally, map make_model_code to actual make and model
-        make = 'Unknown'  # Or extract based on make_model_code
-        model = 'Unknown'  # Or extract based on make_model_code
-
-        # Add or update inventory using make_model_code as the barcode
-        action = add_or_update_inventory(
-            session,
-            make_model_code,
-            name=name,       # Pass the name
-            make=make,
-            model=model,
-            color='Unknown'
-        )
-
-        app.logger.info(f'Barcode processing complete. Action: {action}')
-        return jsonify({"status": "success", "action": action, "barcode_type": barcode_type}), 200
-
-    except SQLAlchemyError as e:
-        session.rollback()
-        app.logger.error("Database error:", exc_info=True)
-        return jsonify({"error": "Database error occurred.", "details": str(e)}), 500  # Include error details
-    except Exception as e:
-        session.rollback()
-        app.logger.error("Error processing request:", exc_info=True)
-        return jsonify({"error": "An error occurred while processing the request.", "details": str(e)}), 500
-    finally:
-        session.close()
+    _init_schema()
+    # The with block closes the session, rolling back anything left uncommitted after an error
+    with Session() as session:
+        try:
+            app.logger.info('Received request at /scan')
+            data = request.get_json()
+            app.logger.debug(f"Request data: {data}")
+
+            # Batch form: {"barcodes": [...]} processed in one transaction
+            barcodes = data.get('barcodes')
+            if barcodes is not None:
+                if not isinstance(barcodes, list) or not barcodes or \
+                        not all(isinstance(barcode, str) and barcode for barcode in barcodes):
+                    app.logger.warning('Invalid barcodes list provided in the request.')
+                    return jsonify({"error": "Invalid barcodes provided."}), 400
+                if len(barcodes) > MAX_SCAN_BATCH:
+                    app.logger.warning(f'Batch of {len(barcodes)} barcodes exceeds the limit of {MAX_SCAN_BATCH}.')
+                    return jsonify({"error": f"At most {MAX_SCAN_BATCH} barcodes per batch."}), 400
+
+                counts = Counter(extract_make_model(barcode) for barcode in barcodes)
+                if not all(counts):
+                    return jsonify({"error": "Invalid barcode format."}), 400
+
+                items = add_or_update_inventory_batch(
+                    session,
+                    counts,
+                    resolve_barcode_name
+                )
+                app.logger.info(f'Batch barcode processing complete: {len(barcodes)} scans')
+                return jsonify({
+                    "status": "success",
+                    "items": items,
+                    "barcode_types": [determine_barcode_type(barcode) for barcode in barcodes]
+                }), 200
+
+            barcode_data = data.get('barcode')
+            app.logger.debug(f"Barcode data: {barcode_data}")
+
+            if not barcode_data or not isinstance(barcode_data, str):
+                app.logger.warning('Invalid barcode data provided in the request.')
+                return jsonify({"error": "Invalid barcode provided."}), 400
+
+            # Drop autorepeat duplicates
+            scan_key = (barcode_data, request.remote_addr)
+            recent = get_recent_scan(scan_key)
+            if recent is not None:
+                app.logger.debug(f"Duplicate scan of {barcode_data} within debounce window; skipped")
+                return jsonify(recent), 200
+
+            # Extract the make/model code from the barcode
+            make_model_code = extract_make_model(barcode_data)
+            if not make_model_code:
+                return jsonify({"error": "Invalid barcode format."}), 400
+            app.logger.debug(f"Extracted make/model code: {make_model_code}")
+
+            # Determine the barcode type
+            barcode_type = determine_barcode_type(barcode_data)
+
+            # Get the name associated with the barcode
+            name = resolve_barcode_name(make_model_code)  # Longest mapped prefix, or 'Unknown'
+
+            # Optionally, map make_model_code to actual make and model
+            make = 'Unknown'  # Or extract based on make_model_code
+            model = 'Unknown'  # Or extract based on make_model_code
+
+            # Add or update inventory using make_model_code as the barcode
+            action = add_or_update_inventory(
+                session,
+                make_model_code,
+                name=name,       # Pass the name
+                make=make,
+                model=model,
+                color='Unknown'
+            )
+
+            app.logger.info(f'Barcode processing complete. Action: {action}')
+            body = {"status": "success", "action": action, "barcode_type": barcode_type}
+            remember_scan(scan_key, body)
+            return jsonify(body), 200
+
+        except RequestEntityTooLarge:
+            app.logger.warning('Request body exceeds MAX_CONTENT_LENGTH.')
+            return jsonify({"error": "Request body too large."}), 413
+        except SQLAlchemyError as e:
+            app.logger.error("Database error:", exc_info=True)
+            return jsonify({"error": "Database error occurred.", "details": str(e)}), 500  # Include error details
+        except Exception as e:
+            app.logger.error("Error processing request:", exc_info=True)
+            return jsonify({"error": "An error occurred while processing the request.", "details": str(e)}), 500
+
+# Worker threads for the WSGI server; matches the engine's pool_size
+WSGI_THREADS = 16
 
 if __name__ == '__main__':
     app.logger.debug("Starting Flask app with ngrok and MQTT")
+    # waitress is optional; without it, fall back to Flask's threaded development server
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
     try:
-        app.run(host='0.0.0.0', port=5000, debug=True)
+        if serve:
+            serve(app, host='0.0.0.0', port=5000, threads=WSGI_THREADS)
+        else:
+            app.logger.warning("waitress is not installed; using the Flask development server")
+            app.run(host='0.0.0.0', port=5000, threaded=True)
     except Exception as e:
         app.logger.error(f"Error starting Flask app: {str(e)}")